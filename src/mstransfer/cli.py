@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import array
+import contextlib
+import os
 import socket
 import sys
+import threading
+import time
 from typing import TYPE_CHECKING
 
 import httpx
@@ -10,7 +15,12 @@ import uvicorn
 from rich.live import Live
 from rich.table import Table
 
-from mstransfer.client.sender import resolve_inputs, send_batch
+from mstransfer.client.sender import (
+    DEFAULT_CHUNK_SIZE,
+    resolve_inputs,
+    send_batch,
+    tcp_tuned_transport,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -67,17 +77,45 @@ def cmd_serve(args: argparse.Namespace) -> None:
             )
             sys.exit(1)
 
-    app = create_app(output_dir=args.output_dir, store_as=args.store_as)
     console.print(
         f"[bold green]mstransfer server[/] starting on "
         f"[cyan]{args.host}:{args.port}[/] "
-        f"(store-as={args.store_as}, output={args.output_dir})"
+        f"(store-as={args.store_as}, output={args.output_dir}, "
+        f"workers={args.workers})"
     )
-    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+    if args.workers > 1:
+        # Multiprocess mode needs an import-string factory; pass the
+        # per-worker configuration through the environment.
+        os.environ["MSTRANSFER_OUTPUT_DIR"] = args.output_dir
+        os.environ["MSTRANSFER_STORE_AS"] = args.store_as
+        os.environ["MSTRANSFER_WORKERS"] = str(args.workers)
+        uvicorn.run(
+            "mstransfer.server.app:create_app_from_env",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            log_level="warning",
+            workers=args.workers,
+        )
+    else:
+        # Same env var the multi-worker factory reads, so enabling auth
+        # doesn't silently depend on the worker count.
+        app = create_app(
+            output_dir=args.output_dir,
+            store_as=args.store_as,
+            api_key=os.environ.get("MSTRANSFER_API_KEY") or None,
+        )
+        uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
 
 
 class UploadProgressDisplay:
-    """Rich-based implementation of BatchProgressCallback for the CLI."""
+    """Rich-based implementation of BatchProgressCallback for the CLI.
+
+    Upload threads only bump a per-file byte counter; `refresh()` (driven
+    by a single display thread at ~10 Hz) pushes the accumulated counts
+    into Rich. This keeps Rich's internal lock off the per-chunk hot path
+    entirely.
+    """
 
     def __init__(self, total_files: int) -> None:
         self.overall = make_overall_progress()
@@ -87,6 +125,9 @@ class UploadProgressDisplay:
         self.table.add_row(self.overall)
         self.table.add_row(self.files)
         self._task_ids: dict[int, TaskID] = {}
+        self._counters = array.array("Q", [0] * total_files)
+        self._reported = array.array("Q", [0] * total_files)
+        self._refresh_lock = threading.Lock()
 
     def file_started(
         self, index: int, file_path: Path, total_bytes: int | None,
@@ -95,21 +136,72 @@ class UploadProgressDisplay:
         self._task_ids[index] = task_id
 
     def file_progress(self, index: int, delta: int) -> None:
-        self.files.advance(self._task_ids[index], delta)
+        # The in-place add is not atomic (load, add, store bytecodes),
+        # but exactly one thread writes each index at a time — the
+        # intra-parallel path serializes its callback fan-in client-side
+        # — so no update can be lost.
+        self._counters[index] += delta
+
+    def refresh(self) -> None:
+        """Push accumulated byte counts into the Rich progress bars."""
+        with self._refresh_lock:
+            for index, task_id in list(self._task_ids.items()):
+                total = self._counters[index]
+                diff = total - self._reported[index]
+                if diff:
+                    self.files.advance(task_id, diff)
+                    self._reported[index] = total
 
     def file_done(self, index: int, result: UploadResponse) -> None:
+        self.refresh()
         task_id = self._task_ids[index]
         desc = self.files.tasks[task_id].description
         self.files.update(task_id, description=f"[green]{desc}")
         self.overall.advance(self.overall_task)
 
     def file_error(self, index: int, exc: Exception) -> None:
+        self.refresh()
         task_id = self._task_ids[index]
         desc = self.files.tasks[task_id].description
         self.files.update(task_id, description=f"[red]{desc}")
         self.overall.advance(self.overall_task)
 
 
+def check_server(client: httpx.Client, base_url: str, attempts: int = 3) -> None:
+    """Verify the server is reachable before starting uploads.
+
+    Uses HEAD to skip the response body, and runs on the shared upload
+    client so the health check's keep-alive connection is reused for the
+    first POST. Retries with exponential backoff (honoring Retry-After)
+    while the server is still starting; exits on failure.
+    """
+    delay = 0.5
+    for attempt in range(attempts):
+        try:
+            resp = client.head(f"{base_url}/v1/health", timeout=5.0)
+        except httpx.ConnectError:
+            resp = None
+        except httpx.TimeoutException:
+            console.print(f"[red]Server at {base_url} did not respond in time.")
+            sys.exit(1)
+
+        # Only a 200 from the health route counts — anything else (404,
+        # 405, auth failures) means this is not a ready mstransfer server.
+        if resp is not None and resp.status_code == 200:
+            return
+
+        if attempt < attempts - 1:
+            wait = delay
+            if resp is not None and "Retry-After" in resp.headers:
+                with contextlib.suppress(ValueError):
+                    wait = float(resp.headers["Retry-After"])
+            time.sleep(wait)
+            delay *= 2
+
+    console.print(f"[red]Cannot connect to server at {base_url}. Is it running?")
+    sys.exit(1)
+
+
 def cmd_upload(args: argparse.Namespace) -> None:
     setup_logging()
 
@@ -126,31 +218,57 @@ def cmd_upload(args: argparse.Namespace) -> None:
         console.print(f"[red]{exc}")
         sys.exit(1)
 
-    # Quick healthcheck before starting uploads.
-    try:
-        httpx.get(f"{base_url}/v1/health", timeout=5.0)
-    except httpx.ConnectError:
-        console.print(f"[red]Cannot connect to server at {base_url}. Is it running?")
-        sys.exit(1)
-    except httpx.TimeoutException:
-        console.print(f"[red]Server at {base_url} did not respond in time.")
-        sys.exit(1)
-
-    console.print(
-        f"Sending [bold]{len(file_paths)}[/] file(s) to "
-        f"[cyan]{base_url}[/] (parallel={args.parallel})"
+    # One pooled client for the health check and all uploads: the check
+    # primes a keep-alive connection that the first POST then reuses.
+    workers = min(args.parallel, len(file_paths))
+    limits = httpx.Limits(
+        max_connections=workers,
+        max_keepalive_connections=workers,
     )
+    client = httpx.Client(
+        timeout=httpx.Timeout(3600.0, connect=10.0),
+        limits=limits,
+        transport=tcp_tuned_transport(limits) if args.tcp_tuning else None,
+    )
+    try:
+        check_server(client, base_url)
 
-    display = UploadProgressDisplay(len(file_paths))
-
-    with Live(display.table, console=console, refresh_per_second=10):
-        results = send_batch(
-            file_paths, base_url,
-            parallel=args.parallel,
-            chunk_size=args.chunk_size,
-            progress=display,
+        console.print(
+            f"Sending [bold]{len(file_paths)}[/] file(s) to "
+            f"[cyan]{base_url}[/] (parallel={args.parallel})"
         )
 
+        display = UploadProgressDisplay(len(file_paths))
+
+        with Live(display.table, console=console, refresh_per_second=10):
+            # Snapshot the byte counters into Rich at display rate; upload
+            # threads never touch Rich directly.
+            stop_refresh = threading.Event()
+
+            def refresh_loop() -> None:
+                while not stop_refresh.is_set():
+                    display.refresh()
+                    stop_refresh.wait(0.1)
+
+            refresher = threading.Thread(target=refresh_loop, daemon=True)
+            refresher.start()
+            try:
+                results = send_batch(
+                    file_paths, base_url,
+                    parallel=args.parallel,
+                    chunk_size=args.chunk_size,
+                    adaptive_chunk_size=args.adaptive_chunk_size,
+                    intra_parallel=args.intra_parallel,
+                    progress=display,
+                    client=client,
+                )
+            finally:
+                stop_refresh.set()
+                refresher.join()
+                display.refresh()
+    finally:
+        client.close()
+
     ok = sum(
         1 for r in results
         if r.response and r.response.state == TransferState.DONE
@@ -189,6 +307,13 @@ def main() -> None:
         default="msz",
         help="Storage format (default: msz)",
     )
+    lp.add_argument(
+        "--workers",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Server worker processes so concurrent uploads don't share "
+        "one GIL (default: min(4, CPU count))",
+    )
     lp.set_defaults(func=cmd_serve)
 
     # --- upload ---
@@ -214,8 +339,25 @@ def main() -> None:
     sp.add_argument(
         "--chunk-size",
         type=int,
-        default=1_048_576,
-        help="Upload chunk size in bytes (default: 1048576)",
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Upload chunk size in bytes (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    sp.add_argument(
+        "--adaptive-chunk-size",
+        action="store_true",
+        help="Grow/shrink the chunk size with measured upload throughput",
+    )
+    sp.add_argument(
+        "--intra-parallel",
+        type=int,
+        default=1,
+        help="Concurrent range requests per large .msz file (default: 1)",
+    )
+    sp.add_argument(
+        "--tcp-tuning",
+        action="store_true",
+        help="Tune upload sockets (TCP_NODELAY, larger send buffer) for "
+        "high-bandwidth links",
     )
     sp.set_defaults(func=cmd_upload)
 
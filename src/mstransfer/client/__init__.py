@@ -1,3 +1,10 @@
 from mstransfer.client.sender import resolve_inputs, send_batch, send_file
+from mstransfer.client.sender_async import send_batch_async, send_file_async
 
-__all__ = ["resolve_inputs", "send_batch", "send_file"]
+__all__ = [
+    "resolve_inputs",
+    "send_batch",
+    "send_batch_async",
+    "send_file",
+    "send_file_async",
+]
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import contextlib
 import logging
+import os
+import queue
+import socket
+import threading
 import time
 import uuid
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
@@ -12,16 +23,46 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 import httpx
+import msgspec
 from mscompress import MSZFile, MZMLFile
 from mscompress.mszx import MSZXFile
 from mscompress.utils import detect_filetype
 
-from mstransfer.server.models import TransferRecord, TransferState, UploadResponse
+from mstransfer.server.models import (
+    BatchSubmitResponse,
+    TransferRecord,
+    TransferState,
+    UploadResponse,
+)
 
 logger = logging.getLogger(__name__)
 
 VALID_EXTENSIONS = {".mzml", ".msz", ".mszx"}
 VALID_FORMATS = {"mzML", "msz", "mszx"}
+SUFFIX_TO_FORMAT = {".mzml": "mzML", ".msz": "msz", ".mszx": "mszx"}
+
+# Default upload chunk size. Larger chunks mean fewer Python-level
+# iterations and syscalls per transferred byte.
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Bounds and window for adaptive chunk sizing.
+_MIN_CHUNK_SIZE = 64 * 1024
+_MAX_CHUNK_SIZE = 64 * 1024 * 1024
+_ADAPT_WINDOW = 4
+
+# Minimum file size before intra-file parallel uploads are worth the
+# extra requests.
+_INTRA_MIN_SIZE = 8 * 1024 * 1024
+
+# Already-compressed files below this size are eligible for bundling
+# into a single request when send_batch(bundle_small=True).
+_BUNDLE_MAX_FILE_SIZE = 4 * 1024 * 1024
+
+# Cap on one bundle's total payload. The client concatenates the group
+# in memory and the server buffers the whole body, so eligible files
+# are split into groups under this size rather than sent as one
+# arbitrarily large request.
+_BUNDLE_MAX_TOTAL_SIZE = 20 * 1024 * 1024
 
 
 @runtime_checkable
@@ -49,52 +90,334 @@ class FileResult:
     error: str | None = field(default=None)
 
 
+def _scan_dir(root: Path, recursive: bool, found: set[Path]) -> None:
+    """Collect valid MS files under `root` with a single scandir walk.
+
+    `os.scandir` yields file type from the directory entry itself, so no
+    per-entry stat call is needed, and one traversal covers every case
+    variant of the extensions at once.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif (
+                        os.path.splitext(entry.name)[1].lower()
+                        in VALID_EXTENSIONS
+                    ):
+                        found.add(Path(entry.path))
+        except OSError as exc:
+            # One unreadable subdirectory shouldn't abort the whole
+            # upload — warn and move on, as Path.glob's suppression did.
+            logger.warning("Skipping unreadable directory %s: %s", current, exc)
+
+
 def resolve_inputs(paths: list[str], recursive: bool = False) -> list[Path]:
     """Resolve files and directories into a sorted list of valid MS files."""
-    result: list[Path] = []
+    found: set[Path] = set()
     for p in paths:
         path = Path(p)
         if path.is_file():
             if path.suffix.lower() in VALID_EXTENSIONS:
-                result.append(path)
+                found.add(path)
             else:
                 logger.warning("Skipping unsupported file: %s", path)
         elif path.is_dir():
-            for ext in ("*.mzML", "*.msz", "*.mzml", "*.MSZ"):
-                if recursive:
-                    result.extend(path.rglob(ext))
-                else:
-                    result.extend(path.glob(ext))
-            result = list(dict.fromkeys(result))
+            _scan_dir(path, recursive, found)
         else:
             logger.warning("Path does not exist: %s", path)
-    if not result:
+    if not found:
         raise FileNotFoundError("No valid .mzML or .msz files found in the given paths")
-    return sorted(set(result))
+    return sorted(found)
+
+
+def tcp_tuned_transport(limits: httpx.Limits | None = None) -> httpx.HTTPTransport:
+    """Build a transport with socket options tuned for bulk uploads.
+
+    Disables Nagle so the sub-MTU tail write of each chunk is sent
+    immediately, widens the kernel send buffer so a single connection
+    can fill high bandwidth-delay-product links, and (where available)
+    caps the unsent-data watermark so writes block before overfilling
+    the buffer.
+    """
+    options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, 8 << 20),
+    ]
+    if hasattr(socket, "TCP_NOTSENT_LOWAT"):  # Linux / macOS
+        options.append((socket.IPPROTO_TCP, socket.TCP_NOTSENT_LOWAT, 128 << 10))
+    if limits is None:
+        return httpx.HTTPTransport(socket_options=options)
+    # An explicit transport bypasses the client's `limits`, so apply them here.
+    return httpx.HTTPTransport(socket_options=options, limits=limits)
 
 
 def _counting_generator(iterator, callback: Callable[[int], None] | None = None):
-    """Wrap an iterator, calling callback with byte count per chunk."""
-    for chunk in iterator:
-        if callback:
-            callback(len(chunk))
-        yield chunk
+    """Wrap an iterator, calling callback with byte count per chunk.
+
+    Without a callback the iterator is returned untouched — no wrapping
+    generator frame in the hot path. With one, callback and len are
+    bound to locals so the per-chunk loop avoids global lookups.
+    """
+    if callback is None:
+        return iterator
+
+    def _counted(it=iterator, cb=callback, _len=len):
+        for chunk in it:
+            cb(_len(chunk))
+            yield chunk
+
+    return _counted()
+
+
+def _pipelined_iterator(source_iter, depth: int = 4):
+    """Drain an iterator from a producer thread through a bounded queue.
+
+    Consuming `compress_stream` directly from httpx's send loop
+    alternates CPU-bound compression and network writes, so neither runs
+    at full duty cycle. A producer thread compresses the next chunks
+    while the current one is on the wire; mscompress releases the GIL,
+    so the overlap is real. The bounded queue caps read-ahead memory.
+    """
+    done = object()
+    chunks: queue.Queue = queue.Queue(maxsize=depth)
+    abandoned = threading.Event()
+
+    def produce() -> None:
+        try:
+            for chunk in source_iter:
+                chunks.put(chunk)
+                if abandoned.is_set():
+                    return
+            chunks.put(done)
+        except BaseException as exc:  # re-raised in the consumer
+            chunks.put(exc)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # If the consumer stops early (httpx closing the body on a send
+        # failure), unpark the producer so its thread exits instead of
+        # blocking forever on a full queue.
+        abandoned.set()
+        while producer.is_alive():
+            with contextlib.suppress(queue.Empty):
+                chunks.get_nowait()
+            producer.join(timeout=0.01)
+
+
+class _ThrottledCallback:
+    """Aggregate progress deltas and forward them at a capped rate.
+
+    Per-chunk callbacks feed straight into Rich's locked Progress
+    bookkeeping in the CLI; batching deltas until either threshold is
+    crossed keeps upload threads from serializing on display updates.
+    Call `flush()` once the transfer finishes to deliver the remainder.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[int], None],
+        min_bytes: int = 16 * 1024 * 1024,
+        min_interval: float = 0.1,
+    ) -> None:
+        self._callback = callback
+        self._min_bytes = min_bytes
+        self._min_interval = min_interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def __call__(self, delta: int) -> None:
+        self._pending += delta
+        now = time.monotonic()
+        if (
+            self._pending >= self._min_bytes
+            or now - self._last_flush >= self._min_interval
+        ):
+            self._callback(self._pending)
+            self._pending = 0
+            self._last_flush = now
+
+    def flush(self) -> None:
+        if self._pending:
+            self._callback(self._pending)
+            self._pending = 0
+        self._last_flush = time.monotonic()
+
+
+class _LockedCallback:
+    """Serialize a progress callback shared by several threads.
+
+    The intra-parallel upload path fans one per-file callback out to N
+    range threads; downstream counters (e.g. the CLI's per-file byte
+    array) assume a single writer per file, so the fan-in takes a lock.
+    """
+
+    __slots__ = ("_callback", "_lock")
+
+    def __init__(self, callback: Callable[[int], None]) -> None:
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def __call__(self, delta: int) -> None:
+        with self._lock:
+            self._callback(delta)
+
+
+def _advise_sequential(f) -> None:
+    """Hint the kernel that a file will be read sequentially, if supported.
+
+    POSIX_FADV_SEQUENTIAL doubles the kernel readahead window so large
+    streaming reads spend less time blocked on disk. Purely advisory —
+    silently skipped on platforms/filesystems without it.
+    """
+    if hasattr(os, "posix_fadvise"):
+        with contextlib.suppress(OSError):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+class _ProgressFileReader:
+    """File-like reader that reports bytes read to a progress callback.
+
+    httpx consumes objects with a `read` method directly, pulling large
+    blocks straight off the OS file — no Python-level chunk generator or
+    per-chunk bytes copies in between.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        callback: Callable[[int], None] | None = None,
+    ) -> None:
+        # The handle outlives __init__ by design: httpx drives read() until
+        # EOF and send_file closes the reader in its finally.
+        self._file = open(file_path, "rb")  # noqa: SIM115
+        _advise_sequential(self._file)
+        self._callback = callback
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        if chunk and self._callback:
+            self._callback(len(chunk))
+        return chunk
+
+    def __iter__(self):
+        # httpx type-checks content against Iterable, then prefers `read`
+        # when present; this also makes the reader usable as a plain
+        # chunk iterator.
+        while chunk := self.read(65_536):
+            yield chunk
+
+    def close(self) -> None:
+        self._file.close()
 
 
 def _file_chunk_generator(
     file_path: Path,
-    chunk_size: int = 1_048_576,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
     callback: Callable[[int], None] | None = None,
 ):
-    """Read a file in chunks, calling callback with each chunk's size."""
-    with open(file_path, "rb") as f:
+    """Read a file in chunks, calling callback with each chunk's size.
+
+    Reads go through `readinto` on a pair of reusable buffers and chunks
+    are yielded as memoryview slices, so a large file costs two buffer
+    allocations total instead of one bytes object per chunk. Each chunk
+    is only valid until the next-but-one iteration; consumers must copy
+    if they need to keep it.
+    """
+    buffers = (bytearray(chunk_size), bytearray(chunk_size))
+    # At large chunk sizes Python's BufferedReader is a pointless extra
+    # copy — read straight from the fd instead. Small chunks keep the
+    # default buffering so they don't degrade into tiny syscalls.
+    buffering = 0 if chunk_size >= 65_536 else -1
+    with open(file_path, "rb", buffering=buffering) as f:
+        _advise_sequential(f)
+        i = 0
         while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
+            buf = buffers[i & 1]
+            n = f.readinto(buf)
+            if not n:
                 break
             if callback:
-                callback(len(chunk))
-            yield chunk
+                callback(n)
+            yield memoryview(buf)[:n]
+            i += 1
+
+
+def _adaptive_chunk_generator(
+    file_path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    callback: Callable[[int], None] | None = None,
+):
+    """Read a file in chunks, adapting the chunk size to upload throughput.
+
+    Throughput is sampled over a small window of chunks (measured from yield
+    to yield, so it includes the consumer's network send). The chunk size is
+    doubled while throughput keeps improving and halved when it drops,
+    bounded by [_MIN_CHUNK_SIZE, _MAX_CHUNK_SIZE].
+    """
+    current = chunk_size
+    prev_rate = 0.0
+    with open(file_path, "rb") as f:
+        _advise_sequential(f)
+        eof = False
+        while not eof:
+            window_bytes = 0
+            start = time.monotonic()
+            for _ in range(_ADAPT_WINDOW):
+                chunk = f.read(current)
+                if not chunk:
+                    eof = True
+                    break
+                window_bytes += len(chunk)
+                if callback:
+                    callback(len(chunk))
+                yield chunk
+            elapsed = time.monotonic() - start
+            if window_bytes and elapsed > 0:
+                rate = window_bytes / elapsed
+                if prev_rate and rate >= prev_rate * 1.10:
+                    current = min(current * 2, _MAX_CHUNK_SIZE)
+                elif prev_rate and rate < prev_rate * 0.90:
+                    current = max(current // 2, _MIN_CHUNK_SIZE)
+                prev_rate = rate
+
+
+def _normalize_source(
+    source: Path | MZMLFile | MSZFile | MSZXFile,
+) -> tuple[Path, str, MZMLFile | None]:
+    """Normalize an upload source into (file_path, filetype, mzml_obj)."""
+    if isinstance(source, MZMLFile):
+        return Path(source.path.decode()), "mzML", source
+    if isinstance(source, MSZFile):
+        return Path(source.path.decode()), "msz", None
+    if isinstance(source, MSZXFile):
+        return source.archive_path, "mszx", None
+    if isinstance(source, Path):
+        # Known suffixes are trusted directly; detect_filetype opens and
+        # scans the file header, which is a syscall + read per file that
+        # adds up on large batches. Only unrecognized suffixes are sniffed.
+        filetype = SUFFIX_TO_FORMAT.get(source.suffix.lower())
+        if filetype is None:
+            filetype = detect_filetype(str(source))
+        if filetype not in VALID_FORMATS:
+            raise ValueError(f"Unsupported file type for {source}: {filetype}")
+        mzml_obj = MZMLFile(str(source).encode()) if filetype == "mzML" else None
+        return source, filetype, mzml_obj
+    raise TypeError(f"Unsupported source type: {type(source)}")
 
 
 def send_file(
@@ -102,50 +425,73 @@ def send_file(
     base_url: str,
     progress_callback: Callable[[int], None] | None = None,
     timeout: float = 3600.0,
-    chunk_size: int = 1_048_576,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    adaptive_chunk_size: bool = False,
+    intra_parallel: int = 1,
+    client: httpx.Client | None = None,
+    transfer_id: str | None = None,
 ) -> UploadResponse:
     """Send a single file to the mstransfer listener.
 
     Accepts a file path, or an already-opened MZMLFile / MSZFile / MSZXFile
     from mscompress.  Returns the final transfer status from the server.
+    When `client` is provided (e.g. the pooled client from `send_batch`),
+    its connections are reused instead of opening a fresh one per file.
+    A `transfer_id` pre-allocated by the server (batch submission) is
+    used as-is; otherwise one is generated locally.
     """
-
-    # Generate a unique transfer ID.
-    transfer_id = str(uuid.uuid4())
+    if transfer_id is None:
+        transfer_id = str(uuid.uuid4())
 
     # Normalize source into (file_path, filetype, mzml_obj | None).
-    if isinstance(source, MZMLFile):
-        file_path = Path(source.path.decode())
-        filetype = "mzML"
-        mzml_obj: MZMLFile | None = source
-    elif isinstance(source, MSZFile):
-        file_path = Path(source.path.decode())
-        filetype = "msz"
-        mzml_obj = None
-    elif isinstance(source, MSZXFile):
-        file_path = source.archive_path
-        filetype = "mszx"
-        mzml_obj = None
-    elif isinstance(source, Path):
-        file_path = source
-        filetype = detect_filetype(str(file_path))
-        if filetype not in VALID_FORMATS:
-            raise ValueError(f"Unsupported file type for {file_path}: {filetype}")
-        mzml_obj = MZMLFile(str(file_path).encode()) if filetype == "mzML" else None
-    else:
-        raise TypeError(f"Unsupported source type: {type(source)}")
+    file_path, filetype, mzml_obj = _normalize_source(source)
+
+    # Large compressed files can be fanned out over several concurrent
+    # range requests; mzML stays single-stream (sequential compressor output).
+    if (
+        mzml_obj is None
+        and intra_parallel > 1
+        and file_path.stat().st_size >= _INTRA_MIN_SIZE
+    ):
+        return _send_file_chunked(
+            file_path,
+            base_url,
+            transfer_id=transfer_id,
+            filetype=filetype,
+            progress_callback=progress_callback,
+            timeout=timeout,
+            chunk_size=chunk_size,
+            intra_parallel=intra_parallel,
+            client=client,
+        )
+
+    # Batch progress deltas so per-chunk reporting doesn't hammer the
+    # caller's (often lock-guarded) display code. Flushed after the send.
+    throttled: _ThrottledCallback | None = None
+    if progress_callback is not None:
+        throttled = _ThrottledCallback(progress_callback)
+        progress_callback = throttled
 
     # Build the upload stream.
-    # If its an mzML file, we can use the compress_stream for on-the-fly compression.
+    # If its an mzML file, we can use the compress_stream for on-the-fly
+    # compression, pipelined through a producer thread so compression of
+    # the next chunk overlaps the network write of the current one.
+    reader: _ProgressFileReader | None = None
     if mzml_obj is not None:
         stream = _counting_generator(
-            mzml_obj.compress_stream(chunk_size=chunk_size), progress_callback,
+            _pipelined_iterator(mzml_obj.compress_stream(chunk_size=chunk_size)),
+            progress_callback,
         )
-    # Otherwise, we stream the file in chuncks.
-    else:
-        stream = _file_chunk_generator(
+    # Otherwise, hand httpx the file directly so it can issue large reads
+    # without a chunking generator in the middle. Adaptive mode keeps the
+    # chunking generator so the read size can track throughput.
+    elif adaptive_chunk_size:
+        stream = _adaptive_chunk_generator(
             file_path, chunk_size=chunk_size, callback=progress_callback,
         )
+    else:
+        reader = _ProgressFileReader(file_path, callback=progress_callback)
+        stream = reader
 
     # Construct headers with metadata for the server.
     headers = {
@@ -155,8 +501,18 @@ def send_file(
         "Content-Type": "application/octet-stream",
     }
 
+    # Compressed files have a known size — send a fixed-length body instead
+    # of chunked transfer-encoding.
+    if mzml_obj is None:
+        headers["Content-Length"] = str(file_path.stat().st_size)
+
     # Send the POST request with streaming upload and handle the response.
-    with httpx.Client(timeout=httpx.Timeout(timeout, connect=10.0)) as client:
+    # A caller-provided client is reused (and left open); otherwise a
+    # one-shot client is created for this file only.
+    own_client = client is None
+    if client is None:
+        client = httpx.Client(timeout=httpx.Timeout(timeout, connect=10.0))
+    try:
         resp = client.post(
             f"{base_url}/v1/upload",
             headers=headers,
@@ -165,15 +521,148 @@ def send_file(
         resp.raise_for_status()
         upload_result = UploadResponse.model_validate(resp.json())
 
-    # Poll for server-side processing completion
-    if upload_result.state not in (TransferState.DONE, TransferState.ERROR):
-        state = _poll_status(base_url, transfer_id, timeout=timeout)
-        upload_result.state = state
+        # Wait for server-side processing completion on the same client,
+        # reusing its keep-alive connection.
+        if upload_result.state not in (TransferState.DONE, TransferState.ERROR):
+            upload_result.state = _wait_for_completion(
+                client, base_url, transfer_id, timeout=timeout,
+            )
+    finally:
+        if throttled is not None:
+            throttled.flush()
+        if reader is not None:
+            reader.close()
+        if own_client:
+            client.close()
+
+    return upload_result
+
+
+def _send_file_chunked(
+    file_path: Path,
+    base_url: str,
+    transfer_id: str,
+    filetype: str,
+    progress_callback: Callable[[int], None] | None = None,
+    timeout: float = 3600.0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    intra_parallel: int = 4,
+    client: httpx.Client | None = None,
+) -> UploadResponse:
+    """Upload one compressed file as several concurrent byte-range requests.
+
+    The file is split into `intra_parallel` contiguous ranges, each POSTed
+    to /v1/upload/{id}/chunk with its offset, then finalized with a single
+    /complete call. Multiple TCP flows sidestep per-connection congestion
+    limits on large transfers.
+    """
+    size = file_path.stat().st_size
+    span = -(-size // intra_parallel)  # ceil division
+    ranges = [(start, min(span, size - start)) for start in range(0, size, span)]
+
+    # Every range thread reports through the same per-file callback;
+    # serialize the calls so its consumers only ever see one writer.
+    if progress_callback is not None:
+        progress_callback = _LockedCallback(progress_callback)
+
+    base_headers = {
+        "X-Original-Filename": file_path.name,
+        "X-Source-Format": filetype,
+        "Content-Type": "application/octet-stream",
+    }
+
+    own_client = client is None
+    if client is None:
+        client = httpx.Client(timeout=httpx.Timeout(timeout, connect=10.0))
+    try:
+        def send_range(start: int, length: int) -> None:
+            def range_stream():
+                with open(file_path, "rb") as f:
+                    f.seek(start)
+                    remaining = length
+                    while remaining > 0:
+                        chunk = f.read(min(chunk_size, remaining))
+                        if not chunk:
+                            break
+                        remaining -= len(chunk)
+                        if progress_callback:
+                            progress_callback(len(chunk))
+                        yield chunk
+
+            headers = {**base_headers, "Content-Length": str(length)}
+            resp = client.post(
+                f"{base_url}/v1/upload/{transfer_id}/chunk",
+                params={"offset": start},
+                headers=headers,
+                content=range_stream(),
+            )
+            resp.raise_for_status()
+
+        with ThreadPoolExecutor(max_workers=intra_parallel) as pool:
+            range_futures = [
+                pool.submit(send_range, start, length) for start, length in ranges
+            ]
+            for future in as_completed(range_futures):
+                future.result()
+
+        resp = client.post(f"{base_url}/v1/upload/{transfer_id}/complete")
+        resp.raise_for_status()
+        upload_result = UploadResponse.model_validate(resp.json())
+
+        if upload_result.state not in (TransferState.DONE, TransferState.ERROR):
+            upload_result.state = _wait_for_completion(
+                client, base_url, transfer_id, timeout=timeout,
+            )
+    finally:
+        if own_client:
+            client.close()
 
     return upload_result
 
 
+def _wait_for_completion(
+    client: httpx.Client,
+    base_url: str,
+    transfer_id: str,
+    timeout: float = 300.0,
+) -> TransferState:
+    """Block on the server's SSE events stream until a terminal state.
+
+    Runs on the caller's client so the upload's keep-alive connection pool
+    is reused instead of opening (and handshaking) a fresh one. Falls back
+    to the legacy polling loop if the server does not expose the events
+    endpoint (404) or the stream fails mid-transfer.
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        with client.stream(
+            "GET", f"{base_url}/v1/transfer/{transfer_id}/events",
+        ) as resp:
+            if resp.status_code == 404:
+                return _poll_status(client, base_url, transfer_id, timeout=timeout)
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line.startswith("data: "):
+                    continue
+                record = msgspec.json.decode(line[6:], type=TransferRecord)
+                if record.state in (TransferState.DONE, TransferState.ERROR):
+                    return record.state
+                if time.monotonic() > deadline:
+                    break
+    except httpx.HTTPError as exc:
+        logger.debug(
+            "Events stream unavailable for %s (%s); falling back to polling",
+            transfer_id,
+            exc,
+        )
+        return _poll_status(client, base_url, transfer_id, timeout=timeout)
+    raise TimeoutError(
+        f"Transfer {transfer_id} did not complete within {timeout}s"
+    )
+
+
 def _poll_status(
+    client: httpx.Client,
     base_url: str,
     transfer_id: str,
     timeout: float = 300.0,
@@ -188,57 +677,295 @@ def _poll_status(
     last_state: TransferState | None = None
     last_bytes: int = 0
 
-    # Individual request timeout should be reasonably short.
-    with httpx.Client(timeout=10.0) as client:
-        # Continously poll until we hit a terminal state or exceed the deadline.
-        while time.monotonic() < deadline:
-            # Make a GET request to the status endpoint for this transfer ID.
+    # Continously poll until we hit a terminal state or exceed the deadline.
+    # The plaintext state endpoint keeps this loop free of JSON parsing
+    # and model validation — it only ever needs the state and byte count.
+    # Servers that predate it 404; those still serve the JSON status
+    # route, so switch over instead of sleeping out the whole timeout.
+    legacy = False
+    while time.monotonic() < deadline:
+        state = None
+        bytes_received = 0
+        if legacy:
             resp = client.get(f"{base_url}/v1/transfer/{transfer_id}/status")
             if resp.status_code == 200:
-                record = TransferRecord.model_validate(resp.json())
+                record = msgspec.json.decode(resp.content, type=TransferRecord)
+                state = record.state
+                bytes_received = record.bytes_received
+        else:
+            resp = client.get(f"{base_url}/v1/transfer/{transfer_id}/state")
+            if resp.status_code == 200:
+                state_str, _, bytes_str = resp.text.strip().partition(" ")
+                state = TransferState(state_str)
+                bytes_received = int(bytes_str)
+            elif resp.status_code == 404:
+                legacy = True
+                continue
 
-                # If the transfer is done or errored, return the final state.
-                if record.state in (TransferState.DONE, TransferState.ERROR):
-                    return record.state
+        if state is not None:
+            # If the transfer is done or errored, return the final state.
+            if state in (TransferState.DONE, TransferState.ERROR):
+                return state
 
-                # Reset deadline if the server is still making progress
-                # Either by a state change or receiving more bytes.
-                if record.state != last_state or record.bytes_received > last_bytes:
-                    last_state = record.state
-                    last_bytes = record.bytes_received
-                    deadline = time.monotonic() + timeout
-            # Sleep until the next poll interval before checking again.
-            time.sleep(interval)
+            # Reset deadline if the server is still making progress
+            # Either by a state change or receiving more bytes.
+            if state != last_state or bytes_received > last_bytes:
+                last_state = state
+                last_bytes = bytes_received
+                deadline = time.monotonic() + timeout
+        # Sleep until the next poll interval before checking again.
+        time.sleep(interval)
     raise TimeoutError(
         f"Transfer {transfer_id} did not complete within {timeout}s"
     )
 
 
+class _ConcurrencyController:
+    """Adapt batch concurrency to observed per-upload throughput.
+
+    Starts at the configured maximum. Every completed upload contributes
+    a bytes/sec sample compared against the previous one: holding within
+    10% (or improving) resets the slow streak and grows the target back
+    toward the maximum, while two consecutive decelerating samples halve
+    it (floor 1). Successive-sample comparison (not an all-time best)
+    matters for mixed batches: compression-bound .mzML uploads run far
+    below .msz wire speed without that being congestion, and only a
+    sustained decline should shed workers.
+    """
+
+    __slots__ = ("maximum", "target", "_prev_rate", "_slow_streak")
+
+    def __init__(self, maximum: int) -> None:
+        self.maximum = maximum
+        self.target = maximum
+        self._prev_rate = 0.0
+        self._slow_streak = 0
+
+    def record(self, nbytes: int, elapsed: float) -> None:
+        if nbytes <= 0 or elapsed <= 0:
+            return
+        rate = nbytes / elapsed
+        prev, self._prev_rate = self._prev_rate, rate
+        if rate >= prev * 0.90:
+            self._slow_streak = 0
+            if self.target < self.maximum:
+                self.target += 1
+        else:
+            self._slow_streak += 1
+            if self._slow_streak >= 2:
+                self.target = max(1, self.target // 2)
+                self._slow_streak = 0
+
+
+class _IndexedProgress:
+    """Per-file progress callback bound to a batch index.
+
+    Cheaper than a nested closure per file: a single small instance with
+    __slots__, no cell objects or captured frames, which adds up on
+    batches of thousands of files.
+    """
+
+    __slots__ = ("progress", "index")
+
+    def __init__(self, progress: BatchProgressCallback, index: int) -> None:
+        self.progress = progress
+        self.index = index
+
+    def __call__(self, delta: int) -> None:
+        self.progress.file_progress(self.index, delta)
+
+
+def _bundle_groups(small: list[tuple[int, int]]) -> list[list[int]]:
+    """Split (index, size) pairs into groups under the bundle size cap.
+
+    Each group becomes one bundled request, so the cap bounds how many
+    payload bytes the client concatenates (and the server buffers) per
+    request regardless of how many small files the batch holds.
+    """
+    groups: list[list[int]] = []
+    group: list[int] = []
+    group_bytes = 0
+    for idx, size in small:
+        if group and group_bytes + size > _BUNDLE_MAX_TOTAL_SIZE:
+            groups.append(group)
+            group, group_bytes = [], 0
+        group.append(idx)
+        group_bytes += size
+    if group:
+        groups.append(group)
+    return groups
+
+
+def _send_bundle(
+    client: httpx.Client,
+    base_url: str,
+    fpaths: list[Path],
+    indices: list[int],
+    transfer_ids: list[str | None],
+    progress: BatchProgressCallback | None,
+    results: list[FileResult | None],
+) -> bool:
+    """Upload several small files as one bundled request.
+
+    The payloads are concatenated into a single body described by a JSON
+    manifest header, so the whole group pays one request's overhead.
+    Per-file results land in `results` exactly as the per-file path
+    would place them. Returns False (without touching `results`) when
+    the server does not expose the bundle endpoint, so the caller can
+    fall back to per-file uploads.
+    """
+    entries = []
+    payloads = []
+    for idx in indices:
+        fpath = fpaths[idx]
+        data = fpath.read_bytes()
+        entries.append({
+            "transfer_id": transfer_ids[idx] or str(uuid.uuid4()),
+            "filename": fpath.name,
+            "size": len(data),
+        })
+        payloads.append(data)
+
+    try:
+        resp = client.post(
+            f"{base_url}/v1/upload/bundle",
+            content=b"".join(payloads),
+            headers={
+                "X-Bundle-Manifest": msgspec.json.encode(entries).decode(),
+                "Content-Type": "application/octet-stream",
+            },
+        )
+        if resp.status_code == 404:
+            logger.debug("Bundle endpoint unavailable; sending per file")
+            return False
+        resp.raise_for_status()
+        records = resp.json()
+    except httpx.HTTPError as exc:
+        for idx, entry in zip(indices, entries, strict=True):
+            if progress:
+                progress.file_started(idx, fpaths[idx], entry["size"])
+                progress.file_error(idx, exc)
+            results[idx] = FileResult(filename=fpaths[idx].name, error=str(exc))
+            logger.error("Failed to send %s: %s", fpaths[idx], exc)
+        return True
+
+    for idx, entry, record in zip(indices, entries, records, strict=True):
+        result = UploadResponse.model_validate(record)
+        results[idx] = FileResult(filename=fpaths[idx].name, response=result)
+        if progress:
+            progress.file_started(idx, fpaths[idx], entry["size"])
+            progress.file_progress(idx, result.bytes_received)
+            progress.file_done(idx, result)
+    return True
+
+
 def send_batch(
     sources: list[Path | MZMLFile | MSZFile | MSZXFile],
     base_url: str,
     parallel: int = 4,
-    chunk_size: int = 1_048_576,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    adaptive_chunk_size: bool = False,
+    intra_parallel: int = 1,
+    bundle_small: bool = False,
     progress: BatchProgressCallback | None = None,
+    timeout: float = 3600.0,
+    client: httpx.Client | None = None,
+    tcp_tuning: bool = False,
 ) -> list[FileResult]:
-    """Send multiple files with configurable parallelism."""
+    """Send multiple files with configurable parallelism.
+
+    When `client` is provided its connection pool is reused (and left
+    open), so e.g. a prior health check's keep-alive connection serves
+    the first upload without a fresh handshake. With `bundle_small`,
+    already-compressed files under 4 MiB are coalesced into a single
+    bundled request instead of one request each.
+    """
     # Set the number of workers.
     workers = min(parallel, len(sources))
 
-    results: list[FileResult] = []
+    # Pre-sized and placed by index: no list growth, and results come back
+    # in submission order regardless of completion order.
+    results: list[FileResult | None] = [None] * len(sources)
 
-    with ThreadPoolExecutor(max_workers=workers) as pool:
-        # Keep track of futures and their corresponding index + file path.
-        futures: dict[Future[UploadResponse], tuple[int, Path]] = {}
+    # One pooled client for the whole batch: TCP (and TLS) handshakes are
+    # paid once per connection instead of once per file, and keep-alive
+    # connections are shared across the worker threads (httpx's pool is
+    # thread-safe).
+    own_client = client is None
+    if client is None:
+        limits = httpx.Limits(
+            max_connections=workers,
+            max_keepalive_connections=workers,
+        )
+        client = httpx.Client(
+            timeout=httpx.Timeout(timeout, connect=10.0),
+            limits=limits,
+            transport=tcp_tuned_transport(limits) if tcp_tuning else None,
+        )
+    # Extract a Path per source for progress reporting and metadata.
+    fpaths: list[Path] = []
+    for source in sources:
+        if isinstance(source, MSZXFile):
+            fpaths.append(source.archive_path)
+        elif isinstance(source, (MZMLFile, MSZFile)):
+            fpaths.append(Path(source.path.decode()))
+        else:
+            fpaths.append(source)
 
-        for idx, source in enumerate(sources):
-            # Extract a Path for progress reporting and metadata.
-            if isinstance(source, MSZXFile):
-                fpath = source.archive_path
-            elif isinstance(source, (MZMLFile, MSZFile)):
-                fpath = Path(source.path.decode())
-            else:
-                fpath = source
+    # Only close the client on exit if we created it.
+    client_cm = client if own_client else contextlib.nullcontext(client)
+    with client_cm, ThreadPoolExecutor(max_workers=workers) as pool:
+        # Pre-register the whole batch in one round-trip and use the
+        # server-allocated transfer IDs. Servers without the endpoint fall
+        # back to client-generated IDs inside send_file.
+        transfer_ids: list[str | None] = [None] * len(sources)
+        try:
+            resp = client.post(
+                f"{base_url}/v1/transfers/batch",
+                json={"files": [p.name for p in fpaths]},
+            )
+            if resp.status_code == 200:
+                manifest = BatchSubmitResponse.model_validate(resp.json())
+                transfer_ids = [t.transfer_id for t in manifest.transfers]
+        except httpx.HTTPError as exc:
+            logger.debug("Batch pre-registration unavailable: %s", exc)
+
+        # Small already-compressed files can go out as one bundled
+        # request; everything else takes the per-file path below.
+        bundled: set[int] = set()
+        if bundle_small:
+            small = [
+                (idx, size)
+                for idx, source in enumerate(sources)
+                if not isinstance(source, (MZMLFile, MSZFile, MSZXFile))
+                and fpaths[idx].suffix.lower() in (".msz", ".mszx")
+                and (size := fpaths[idx].stat().st_size) < _BUNDLE_MAX_FILE_SIZE
+            ]
+            for group in _bundle_groups(small):
+                if len(group) < 2:
+                    continue
+                if not _send_bundle(
+                    client, base_url, fpaths, group, transfer_ids, progress,
+                    results,
+                ):
+                    # No bundle endpoint on this server; the remaining
+                    # groups would 404 the same way.
+                    break
+                bundled.update(group)
+
+        # In-flight futures, keyed to index, file path, and start time.
+        futures: dict[Future[UploadResponse], tuple[int, Path, float]] = {}
+        controller = _ConcurrencyController(workers)
+        pending = iter(
+            idx for idx in range(len(sources)) if idx not in bundled
+        )
+
+        def submit_next() -> bool:
+            idx = next(pending, None)
+            if idx is None:
+                return False
+            source = sources[idx]
+            fpath = fpaths[idx]
 
             # We can determine total bytes for compressed files (MSZ/MSZX).
             # For mzML, compression is on-the-fly so the total is unknown.
@@ -254,39 +981,47 @@ def send_batch(
             if progress:
                 progress.file_started(idx, fpath, total_bytes)
 
-            def make_callback(i: int):
-                """
-                Create a callback function that captures the file index for progress.
-                """
-                def cb(delta: int):
-                    if progress:
-                        progress.file_progress(i, delta)
-                return cb
-
             # Submit the file upload task to the thread pool and store the future.
             future = pool.submit(
                 send_file,
                 source,
                 base_url,
-                progress_callback=make_callback(idx),
+                progress_callback=_IndexedProgress(progress, idx) if progress else None,
                 chunk_size=chunk_size,
+                adaptive_chunk_size=adaptive_chunk_size,
+                intra_parallel=intra_parallel,
+                client=client,
+                transfer_id=transfer_ids[idx],
             )
-            futures[future] = (idx, fpath)
-
-        # As the futures complete,
-        for future in as_completed(futures):
-            # Unpack the index and file path for this future to report progress callback
-            idx, fpath = futures[future]
-            try:
-                result = future.result()
-                results.append(FileResult(filename=fpath.name, response=result))
-                if progress:
-                    progress.file_done(idx, result)
-            # On exception, append a FileResult with the error message.
-            except Exception as exc:
-                results.append(FileResult(filename=fpath.name, error=str(exc)))
-                if progress:
-                    progress.file_error(idx, exc)
-                logger.error("Failed to send %s: %s", fpath, exc)
-
-    return results
+            futures[future] = (idx, fpath, time.monotonic())
+            return True
+
+        # Rolling submission: keep at most controller.target uploads in
+        # flight and hand the next file to whichever slot frees up, so a
+        # slow transfer never blocks the rest of the queue.
+        while len(futures) < controller.target and submit_next():
+            pass
+
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                # Unpack index/path/start time to report progress and throughput.
+                idx, fpath, started = futures.pop(future)
+                try:
+                    result = future.result()
+                    results[idx] = FileResult(filename=fpath.name, response=result)
+                    controller.record(
+                        result.bytes_received, time.monotonic() - started,
+                    )
+                    if progress:
+                        progress.file_done(idx, result)
+                # On exception, record a FileResult with the error message.
+                except Exception as exc:
+                    results[idx] = FileResult(filename=fpath.name, error=str(exc))
+                    if progress:
+                        progress.file_error(idx, exc)
+                    logger.error("Failed to send %s: %s", fpath, exc)
+            while len(futures) < controller.target and submit_next():
+                pass
+
+    return [r for r in results if r is not None]
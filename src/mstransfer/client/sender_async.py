@@ -0,0 +1,278 @@
+"""Async variants of the upload client built on httpx.AsyncClient.
+
+One event loop multiplexes all uploads over a shared connection pool,
+avoiding a thread (and its stack + GIL-serialized callback chain) per
+concurrent file. File reads and compression run via worker threads so
+the loop is never blocked; mscompress releases the GIL so compression
+genuinely overlaps the network sends.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator
+
+    from mscompress import MSZFile, MZMLFile
+    from mscompress.mszx import MSZXFile
+
+import httpx
+import msgspec
+
+from mstransfer.client.sender import (
+    DEFAULT_CHUNK_SIZE,
+    BatchProgressCallback,
+    FileResult,
+    _normalize_source,
+)
+from mstransfer.server.models import TransferRecord, TransferState, UploadResponse
+
+logger = logging.getLogger(__name__)
+
+
+# How many chunks the producer thread may run ahead of the HTTP send.
+# Enough to keep compression busy while a chunk is on the wire, small
+# enough to bound memory at a few chunks.
+_CHUNK_QUEUE_DEPTH = 4
+
+
+async def _athread_chunks(
+    iterator: Iterator[bytes],
+    callback: Callable[[int], None] | None = None,
+) -> AsyncIterator[bytes]:
+    """Drain a blocking chunk iterator from a producer thread, asynchronously.
+
+    One thread runs the iterator ahead of the sender and parks chunks on
+    a bounded queue, so file reads and compression overlap the HTTP send
+    instead of alternating with it (a per-chunk `to_thread` round-trip
+    would serialize the two stages).
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[bytes | BaseException | None] = asyncio.Queue(
+        maxsize=_CHUNK_QUEUE_DEPTH,
+    )
+    abandoned = threading.Event()
+
+    def produce() -> None:
+        try:
+            for chunk in iterator:
+                asyncio.run_coroutine_threadsafe(queue.put(chunk), loop).result()
+                if abandoned.is_set():
+                    return
+            asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+        except BaseException as exc:  # re-raised on the consumer side
+            asyncio.run_coroutine_threadsafe(queue.put(exc), loop).result()
+
+    producer = loop.run_in_executor(None, produce)
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            if callback:
+                callback(len(item))
+            yield item
+    finally:
+        # If the consumer stops early (send failure), unpark the producer
+        # so its thread exits instead of blocking on a full queue.
+        abandoned.set()
+        while not producer.done():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                await asyncio.sleep(0)
+        await producer
+
+
+def _file_chunks(file_path: Path, chunk_size: int) -> Iterator[bytes]:
+    with open(file_path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+async def send_file_async(
+    source: Path | MZMLFile | MSZFile | MSZXFile,
+    base_url: str,
+    progress_callback: Callable[[int], None] | None = None,
+    timeout: float = 3600.0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    client: httpx.AsyncClient | None = None,
+) -> UploadResponse:
+    """Async equivalent of `send_file`.
+
+    Accepts the same sources; when `client` is provided its connection
+    pool is reused and left open.
+    """
+    transfer_id = str(uuid.uuid4())
+    file_path, filetype, mzml_obj = _normalize_source(source)
+
+    if mzml_obj is not None:
+        stream = _athread_chunks(
+            iter(mzml_obj.compress_stream(chunk_size=chunk_size)),
+            progress_callback,
+        )
+    else:
+        stream = _athread_chunks(
+            _file_chunks(file_path, chunk_size), progress_callback,
+        )
+
+    headers = {
+        "X-Transfer-ID": transfer_id,
+        "X-Original-Filename": file_path.name,
+        "X-Source-Format": filetype,
+        "Content-Type": "application/octet-stream",
+    }
+    if mzml_obj is None:
+        headers["Content-Length"] = str(file_path.stat().st_size)
+
+    own_client = client is None
+    if client is None:
+        client = httpx.AsyncClient(timeout=httpx.Timeout(timeout, connect=10.0))
+    try:
+        resp = await client.post(
+            f"{base_url}/v1/upload",
+            headers=headers,
+            content=stream,
+        )
+        resp.raise_for_status()
+        upload_result = UploadResponse.model_validate(resp.json())
+
+        if upload_result.state not in (TransferState.DONE, TransferState.ERROR):
+            upload_result.state = await _wait_for_completion_async(
+                client, base_url, transfer_id, timeout=timeout,
+            )
+    finally:
+        if own_client:
+            await client.aclose()
+
+    return upload_result
+
+
+async def _wait_for_completion_async(
+    client: httpx.AsyncClient,
+    base_url: str,
+    transfer_id: str,
+    timeout: float = 300.0,
+    interval: float = 0.5,
+) -> TransferState:
+    """Block on the server's SSE events stream until a terminal state.
+
+    Falls back to polling the status endpoint if the events stream is
+    unavailable.
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        async with client.stream(
+            "GET", f"{base_url}/v1/transfer/{transfer_id}/events",
+        ) as resp:
+            if resp.status_code != 404:
+                resp.raise_for_status()
+                async for line in resp.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    record = msgspec.json.decode(line[6:], type=TransferRecord)
+                    if record.state in (TransferState.DONE, TransferState.ERROR):
+                        return record.state
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(
+                            f"Transfer {transfer_id} did not complete "
+                            f"within {timeout}s"
+                        )
+    except httpx.HTTPError as exc:
+        logger.debug(
+            "Events stream unavailable for %s (%s); falling back to polling",
+            transfer_id,
+            exc,
+        )
+
+    # Polling fallback.
+    while time.monotonic() < deadline:
+        resp = await client.get(f"{base_url}/v1/transfer/{transfer_id}/status")
+        if resp.status_code == 200:
+            record = msgspec.json.decode(resp.content, type=TransferRecord)
+            if record.state in (TransferState.DONE, TransferState.ERROR):
+                return record.state
+        await asyncio.sleep(interval)
+    raise TimeoutError(
+        f"Transfer {transfer_id} did not complete within {timeout}s"
+    )
+
+
+async def send_batch_async(
+    sources: list[Path | MZMLFile | MSZFile | MSZXFile],
+    base_url: str,
+    parallel: int = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: BatchProgressCallback | None = None,
+    timeout: float = 3600.0,
+) -> list[FileResult]:
+    """Async equivalent of `send_batch`.
+
+    Concurrency is bounded by a semaphore instead of a thread pool; all
+    uploads share one AsyncClient connection pool.
+    """
+    workers = min(parallel, len(sources))
+    semaphore = asyncio.Semaphore(workers)
+    results: list[FileResult | None] = [None] * len(sources)
+
+    limits = httpx.Limits(
+        max_connections=workers,
+        max_keepalive_connections=workers,
+    )
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout, connect=10.0),
+        limits=limits,
+    ) as client:
+
+        async def upload_one(idx: int, source) -> None:
+            try:
+                fpath, _, _ = _normalize_source(source)
+            except (TypeError, ValueError) as exc:
+                name = source.name if isinstance(source, Path) else str(source)
+                results[idx] = FileResult(filename=name, error=str(exc))
+                if progress:
+                    progress.file_error(idx, exc)
+                logger.error("Failed to send %s: %s", source, exc)
+                return
+
+            if progress:
+                is_compressed = fpath.suffix.lower() in (".msz", ".mszx")
+                total = fpath.stat().st_size if is_compressed else None
+                progress.file_started(idx, fpath, total)
+
+            def cb(delta: int) -> None:
+                if progress:
+                    progress.file_progress(idx, delta)
+
+            async with semaphore:
+                try:
+                    result = await send_file_async(
+                        source,
+                        base_url,
+                        progress_callback=cb,
+                        chunk_size=chunk_size,
+                        client=client,
+                    )
+                    results[idx] = FileResult(filename=fpath.name, response=result)
+                    if progress:
+                        progress.file_done(idx, result)
+                except Exception as exc:
+                    results[idx] = FileResult(filename=fpath.name, error=str(exc))
+                    if progress:
+                        progress.file_error(idx, exc)
+                    logger.error("Failed to send %s: %s", fpath, exc)
+
+        await asyncio.gather(
+            *(upload_one(idx, source) for idx, source in enumerate(sources))
+        )
+
+    return [r for r in results if r is not None]
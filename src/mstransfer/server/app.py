@@ -1,26 +1,61 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 
-from mstransfer.server.routes import router
+from mstransfer.server.auth import APIKeyAuthProvider, make_auth_dependency
+from mstransfer.server.routes import FINALIZERS, router, warm_caches
 from mstransfer.server.state import AppState
 
 
 def create_app(
     output_dir: str = "./received",
     store_as: str = "msz",
+    api_key: str | None = None,
+    multi_worker: bool = False,
 ) -> FastAPI:
     """Create a configured mstransfer FastAPI application.
 
     Args:
         output_dir: Directory where received files are stored.
         store_as: Output format — "msz" or "mzml".
+        api_key: Require this shared key on all /v1 routes when set.
+        multi_worker: True when several worker processes serve this app;
+            chunked uploads are rejected since their transfer state
+            cannot span processes.
     """
     app = FastAPI(title="mstransfer")
     out = Path(output_dir)
     out.mkdir(parents=True, exist_ok=True)
-    app.state = AppState(output_dir=out, store_as=store_as)
-    app.include_router(router, prefix="/v1")
+    app.state = AppState(
+        output_dir=out, store_as=store_as, multi_worker=multi_worker,
+    )
+    # Partial evaluation: the storage mode is fixed here, so pick the
+    # matching upload finalizer once instead of branching per request.
+    app.state.finalize_upload = FINALIZERS[store_as]
+    warm_caches(store_as)
+
+    dependencies = None
+    if api_key:
+        provider = APIKeyAuthProvider(api_key)
+        dependencies = [Depends(make_auth_dependency(provider))]
+    app.include_router(router, prefix="/v1", dependencies=dependencies)
     return app
+
+
+def create_app_from_env() -> FastAPI:
+    """App factory for multi-worker servers.
+
+    uvicorn's `factory=True` entry point takes no arguments, so each
+    worker process reads its configuration from MSTRANSFER_OUTPUT_DIR
+    and MSTRANSFER_STORE_AS (set by `cmd_serve`) and builds its own
+    AppState.
+    """
+    return create_app(
+        output_dir=os.environ.get("MSTRANSFER_OUTPUT_DIR", "./received"),
+        store_as=os.environ.get("MSTRANSFER_STORE_AS", "msz"),
+        api_key=os.environ.get("MSTRANSFER_API_KEY") or None,
+        multi_worker=int(os.environ.get("MSTRANSFER_WORKERS", "1")) > 1,
+    )
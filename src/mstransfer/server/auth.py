@@ -0,0 +1,93 @@
+"""Optional shared API-key authentication for the mstransfer server.
+
+Authentication runs on every request once enabled, so the hot paths are
+kept allocation-free: a pre-built AuthContext is returned on success and
+the query string is only parsed when the Authorization header fails.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+
+from fastapi import HTTPException, Request
+from pydantic import BaseModel
+
+_BEARER_PREFIX = "Bearer "
+
+# Per-process pepper for keyed hashing of API keys. Candidates and the
+# configured key are compared as fixed-width BLAKE2b MACs, so comparison
+# cost is 32 bytes regardless of secret length and the key itself is
+# never held in plaintext on the provider.
+_PEPPER = secrets.token_bytes(32)
+
+
+def _key_mac(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=32, key=_PEPPER).digest()
+
+
+class AuthContext(BaseModel):
+    """Identity attached to an authenticated request."""
+    identity: str
+
+
+# Shared instance for the success path — authenticate() allocates nothing.
+_AUTHED_CTX = AuthContext.model_construct(identity="api-key")
+
+
+class APIKeyAuthProvider:
+    """Validates a shared API key from the Authorization header.
+
+    Accepts `Authorization: Bearer <key>`, falling back to an `api_key`
+    query parameter (only parsed when the header check fails). Both sides
+    are reduced to peppered 32-byte MACs before the constant-time
+    compare_digest, so the comparison cost does not scale with the
+    secret's length; the header length fast-path is fine since the key
+    length is not a secret.
+    """
+
+    __slots__ = ("_header_len", "_mac")
+
+    def __init__(self, api_key: str) -> None:
+        self._mac = _key_mac(api_key)
+        self._header_len = len(_BEARER_PREFIX) + len(api_key)
+
+    def authenticate(self, request: Request) -> AuthContext | None:
+        header = request.headers.get("Authorization")
+        if (
+            header is not None
+            and len(header) == self._header_len
+            and header.startswith(_BEARER_PREFIX)
+            and hmac.compare_digest(
+                _key_mac(header[len(_BEARER_PREFIX):]), self._mac
+            )
+        ):
+            return _AUTHED_CTX
+
+        key = request.query_params.get("api_key")
+        if key is not None and hmac.compare_digest(_key_mac(key), self._mac):
+            return _AUTHED_CTX
+        return None
+
+
+class _AuthDep:
+    """FastAPI dependency callable that rejects unauthenticated requests."""
+
+    __slots__ = ("_provider",)
+
+    def __init__(self, provider: APIKeyAuthProvider) -> None:
+        self._provider = provider
+
+    def __call__(self, request: Request) -> AuthContext:
+        ctx = self._provider.authenticate(request)
+        if ctx is None:
+            raise HTTPException(
+                status_code=401, detail="Invalid or missing API key"
+            )
+        return ctx
+
+
+def make_auth_dependency(provider: APIKeyAuthProvider) -> _AuthDep:
+    """Build a dependency enforcing `provider` on the routes it guards."""
+    return _AuthDep(provider)
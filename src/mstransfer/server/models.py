@@ -1,7 +1,8 @@
-from datetime import datetime
+import time
 from enum import Enum
 
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel
 
 
 class TransferState(str, Enum):
@@ -13,17 +14,23 @@ class TransferState(str, Enum):
     ERROR = "error"
 
 
-class TransferRecord(BaseModel):
-    """Data model for a file transfer record in the registry."""
+class TransferRecord(msgspec.Struct, kw_only=True):
+    """Data model for a file transfer record in the registry.
+
+    A msgspec.Struct rather than a pydantic model: records are mutated on
+    the upload hot path and serialized on every status/event response,
+    and msgspec does both without per-field validation. Records are never
+    populated from untrusted input, so nothing is lost.
+    """
     transfer_id: str
     filename: str
     state: TransferState = TransferState.RECEIVING
     bytes_received: int = 0
     stored_as: str = ""
     error: str | None = None
-    created_at: datetime = Field(default_factory=datetime.now)
-
-    model_config = {"from_attributes": True}
+    # Plain epoch seconds: cheaper to stamp than a datetime and serializes
+    # as a bare float instead of an ISO-8601 string.
+    created_at: float = msgspec.field(default_factory=time.time)
 
 
 class UploadResponse(BaseModel):
@@ -35,6 +42,39 @@ class UploadResponse(BaseModel):
     bytes_received: int
 
 
+class BatchSubmitRequest(BaseModel):
+    """Request model for pre-registering a batch of transfers."""
+    files: list[str]
+
+
+class BatchTransferItem(BaseModel):
+    """One allocated transfer in a batch submission manifest."""
+    filename: str
+    transfer_id: str
+
+
+class BatchSubmitResponse(BaseModel):
+    """Response model for a batch submission: the allocated manifest."""
+    transfers: list[BatchTransferItem]
+
+
+class BundleFileEntry(msgspec.Struct):
+    """One file's slot in a bundled upload manifest.
+
+    Decoded with msgspec straight off the X-Bundle-Manifest header —
+    msgspec validates field types on decode, so nothing is lost over a
+    pydantic model on this hot path.
+    """
+    transfer_id: str
+    filename: str
+    size: int
+
+
+class BatchStatusRequest(BaseModel):
+    """Request model for polling several transfers in one request."""
+    ids: list[str]
+
+
 class HealthResponse(BaseModel):
     """Response model for health check endpoint."""
     status: str
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import os
+import uuid
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import aiofiles
 import aiofiles.os
-from fastapi import APIRouter, Depends, HTTPException, Request
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from mscompress import MSZFile
 
 from mstransfer import __version__
 from mstransfer.server.models import (
+    BatchStatusRequest,
+    BatchSubmitRequest,
+    BatchSubmitResponse,
+    BatchTransferItem,
+    BundleFileEntry,
     HealthResponse,
     TransferRecord,
     TransferState,
@@ -32,26 +42,118 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Each aiofiles write hops to the asyncio thread pool and back; ASGI
+# servers deliver bodies in ~64 KiB chunks, so writing them one-by-one
+# pays that hop per chunk. Coalescing into ~1 MiB writes cuts the hops
+# (and write syscalls) by an order of magnitude.
+WRITE_COALESCE_SIZE = 1 << 20
 
+# Hard ceiling on a bundle's declared payload: the whole body is
+# buffered in memory, so an uncapped manifest would let one request pin
+# arbitrary amounts of RAM. Comfortably above the client's ~20 MiB
+# grouping cap, so well-behaved clients never trip it.
+BUNDLE_MAX_BODY_SIZE = 64 << 20
+
+def _stem(filename: str) -> str:
+    """Filename without directory parts or its last suffix.
+
+    Path(...).stem minus the parse — including the basename step, which
+    is what keeps a crafted X-Original-Filename (or bundle manifest
+    entry) containing separators from escaping the output directory.
+    """
+    name = os.path.basename(filename.replace("\\", "/"))
+    return name.rpartition(".")[0] or name
+
+
+# The health payload is static per storage mode — encode it once and
+# serve the cached bytes instead of building and serializing a model on
+# every probe.
+_HEALTH_BODY_CACHE: dict[str, bytes] = {}
+
+
+def warm_caches(store_as: str) -> None:
+    """Pre-build cached responses and encoder state at app creation.
+
+    Called by create_app so the first request after startup does not pay
+    the one-time health-body encode or msgspec's schema build for
+    TransferRecord.
+    """
+    if store_as not in _HEALTH_BODY_CACHE:
+        _HEALTH_BODY_CACHE[store_as] = msgspec.json.encode(
+            {"status": "ok", "version": __version__, "store_as": store_as}
+        )
+    # Encoding a throwaway record compiles msgspec's encoder for the type.
+    msgspec.json.encode(TransferRecord(transfer_id="", filename=""))
+
+
+# HEAD registered explicitly: FastAPI's @get does not answer HEAD, and
+# the CLI's pre-upload health check uses it to skip the response body.
+@router.head("/health", include_in_schema=False)
 @router.get("/health", response_model=HealthResponse)
-async def health(state: AppState = StateDep) -> HealthResponse:
+async def health(state: AppState = StateDep) -> Response:
     """
     Simple health check endpoint that returns the server status, version,
       and storage configuration.
     """
-    return HealthResponse(
-        status="ok",
-        version=__version__,
-        store_as=state.store_as,
+    body = _HEALTH_BODY_CACHE.get(state.store_as)
+    if body is None:
+        body = msgspec.json.encode(
+            {"status": "ok", "version": __version__, "store_as": state.store_as}
+        )
+        _HEALTH_BODY_CACHE[state.store_as] = body
+    return Response(content=body, media_type="application/json")
+
+
+@router.post("/transfers/batch", response_model=BatchSubmitResponse)
+async def submit_batch(
+    req: BatchSubmitRequest, state: AppState = StateDep
+) -> BatchSubmitResponse:
+    """
+    Pre-register a batch of transfers and return the allocated IDs.
+
+    One request replaces a per-file registration round-trip; the client
+    then streams each file to /upload using its assigned transfer ID.
+    """
+    registry = state.transfers
+    transfers = []
+    for filename in req.files:
+        transfer_id = str(uuid.uuid4())
+        registry.create(transfer_id, filename)
+        transfers.append(
+            BatchTransferItem(filename=filename, transfer_id=transfer_id)
+        )
+    logger.info("Pre-registered %d transfer(s)", len(transfers))
+    return BatchSubmitResponse(transfers=transfers)
+
+
+@router.post("/transfer/status")
+async def transfer_status_batch(
+    req: BatchStatusRequest, state: AppState = StateDep
+) -> Response:
+    """
+    Multiplexed status poll: returns the record for every known ID in the
+    request in one round-trip. Unknown IDs are simply omitted.
+    """
+    registry = state.transfers
+    records = {}
+    for transfer_id in req.ids:
+        record = registry.get(transfer_id)
+        if record is not None:
+            records[transfer_id] = record
+    return Response(
+        content=msgspec.json.encode(records), media_type="application/json",
     )
 
 
-@router.get("/transfer/{transfer_id}/status", response_model=TransferRecord)
+@router.get("/transfer/{transfer_id}/status")
 async def transfer_status(
     transfer_id: str, state: AppState = StateDep
-) -> TransferRecord:
+) -> Response:
     """
     Endpoint to check the status of an ongoing or completed transfer by its ID.
+
+    Serialized straight from the registry record with msgspec, bypassing
+    FastAPI's pydantic response pipeline.
     """
     # Get the corresponding transfer record from the registry.
     record = state.transfers.get(transfer_id)
@@ -59,13 +161,69 @@ async def transfer_status(
     # If no record is found, return a 404 error.
     if record is None:
         raise HTTPException(status_code=404, detail="Transfer not found")
-    return record
+    return Response(
+        content=msgspec.json.encode(record), media_type="application/json",
+    )
+
+
+@router.get("/transfer/{transfer_id}/state", response_class=PlainTextResponse)
+async def transfer_state(
+    transfer_id: str, state: AppState = StateDep
+) -> str:
+    """
+    Minimal plaintext status: "<state> <bytes_received>".
+
+    Cheap enough to poll aggressively — no response model to serialize on
+    the server and nothing to JSON-parse on the client.
+    """
+    record = state.transfers.get(transfer_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Transfer not found")
+    return f"{record.state.value} {record.bytes_received}\n"
+
+
+@router.get("/transfer/{transfer_id}/events")
+async def transfer_events(
+    transfer_id: str, state: AppState = StateDep
+) -> StreamingResponse:
+    """
+    Server-sent-events stream of transfer state changes.
+
+    Emits a `data:` line with the full transfer record on every registry
+    mutation (and periodically as a keep-alive), and closes the stream once
+    the transfer reaches a terminal state. Lets clients block on the socket
+    instead of polling the status endpoint.
+    """
+    registry = state.transfers
+    if registry.get(transfer_id) is None:
+        raise HTTPException(status_code=404, detail="Transfer not found")
+
+    async def event_stream():
+        loop = asyncio.get_running_loop()
+        version = -1
+        while True:
+            # Block off the event loop until the registry changes — on
+            # the events pool, not the default executor, so parked
+            # watchers never starve aiofiles writes or decompression.
+            record, version = await loop.run_in_executor(
+                state.events_executor,
+                registry.wait_for_change,
+                transfer_id,
+                version,
+            )
+            if record is None:
+                return
+            yield b"data: " + msgspec.json.encode(record) + b"\n\n"
+            if record.state in (TransferState.DONE, TransferState.ERROR):
+                return
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
 @router.post("/upload", response_model=UploadResponse)
 async def upload(
     request: Request, state: AppState = StateDep
-) -> UploadResponse:
+) -> Response:
     """
     Endpoint to handle file uploads. Expects the file content in the request body
     and requires the following headers:
@@ -76,51 +234,104 @@ async def upload(
     The server will stream the incoming data to a file, update the transfer registry
     with the progress, and optionally decompress if configured to do so.
     """
-    # Get the transfer ID, raise if missing.
-    transfer_id = request.headers.get("X-Transfer-ID")
+    # Pull both headers out of the raw ASGI header list in one pass —
+    # keys arrive lowercased already, so this skips building Starlette's
+    # Headers wrapper and scanning it once per lookup.
+    transfer_id = original_filename = None
+    for key, value in request.scope["headers"]:
+        if key == b"x-transfer-id":
+            transfer_id = value.decode("latin-1")
+        elif key == b"x-original-filename":
+            original_filename = value.decode("latin-1")
+        if transfer_id and original_filename:
+            break
+
     if not transfer_id:
         raise HTTPException(
             status_code=400,
             detail="Missing X-Transfer-ID header"
         )
 
-    # Get the original filename, raise if missing.
-    original_filename = request.headers.get("X-Original-Filename")
     if not original_filename:
         raise HTTPException(
             status_code=400,
             detail="Missing X-Original-Filename header"
         )
 
-    output_dir = state.output_dir
-    store_as = state.store_as
     registry = state.transfers
 
     # Create a new transfer record in the registry.
     registry.create(transfer_id, original_filename)
     logger.info("Receiving %s (transfer_id=%s)", original_filename, transfer_id)
 
-    # Use the filename stem for the output file.
-    stem = Path(original_filename).stem
-    msz_path = output_dir / f"{stem}.msz"
+    # Use the filename stem for the output file. Paths stay plain strings
+    # here — aiofiles takes them as-is, so there is nothing to gain from
+    # building Path objects per request.
+    output_dir_str = state.output_dir_str
+    msz_path = f"{output_dir_str}/{_stem(original_filename)}.msz"
     bytes_received = 0
 
-    # Stream the incoming data to a file asynchronously.
-    update_every = 64  # throttle registry updates to reduce lock overhead
-    chunk_count = 0
+    # Stream into an exclusive per-transfer temp file, renamed into place
+    # once the body is fully received: with several worker processes (or a
+    # retried transfer) sharing the output directory, nothing ever
+    # observes a partially written file.
+    part_path = f"{output_dir_str}/.{transfer_id}.part"
+    write_buffer = bytearray()
     try:
-        async with aiofiles.open(msz_path, "wb") as f:
-            async for chunk in request.stream():
-                await f.write(chunk)
-                bytes_received += len(chunk)
-                chunk_count += 1
-                if chunk_count % update_every == 0:
-                    registry.update(transfer_id, bytes_received=bytes_received)
+        async with aiofiles.open(part_path, "xb") as f:
+            # Producer/consumer split: one task drains the socket into a
+            # bounded queue while the other writes to disk, so network
+            # receive and file I/O overlap instead of alternating. The
+            # queue bound provides backpressure when the disk falls
+            # behind.
+            queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=8)
+
+            async def produce() -> None:
+                nonlocal bytes_received
+                async for chunk in request.stream():
+                    bytes_received += len(chunk)
+                    # Lock-free tally — status readers pick it up on demand.
+                    registry.add_bytes(transfer_id, len(chunk))
+                    await queue.put(chunk)
+                await queue.put(None)
+
+            async def consume() -> None:
+                nonlocal write_buffer
+                while (chunk := await queue.get()) is not None:
+                    # Chunks that already meet the coalesce threshold go to
+                    # the file as-is, skipping the staging copy entirely.
+                    if not write_buffer and len(chunk) >= WRITE_COALESCE_SIZE:
+                        await f.write(chunk)
+                        continue
+                    write_buffer += chunk
+                    if len(write_buffer) >= WRITE_COALESCE_SIZE:
+                        await f.write(write_buffer)
+                        write_buffer.clear()
+                if write_buffer:
+                    await f.write(write_buffer)
+
+            tasks = [
+                asyncio.create_task(produce()),
+                asyncio.create_task(consume()),
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # Either side failing leaves the other blocked on the
+                # queue; cancel both before propagating.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+        await aiofiles.os.replace(part_path, msz_path)
 
         # Final update to ensure accurate total
         registry.update(transfer_id, bytes_received=bytes_received)
 
     except Exception as exc:
+        with contextlib.suppress(OSError):
+            await aiofiles.os.remove(part_path)
         registry.update(transfer_id, state=TransferState.ERROR, error=str(exc))
         raise HTTPException(
             status_code=500, detail=f"Error receiving data: {exc}"
@@ -134,51 +345,286 @@ async def upload(
         transfer_id,
     )
 
-    if store_as == "msz":
-        # If we're storing as .msz, we're done at this point.
-        # Just update the registry with the final path and state.
+    return await state.finalize_upload(
+        state, transfer_id, original_filename, msz_path, bytes_received,
+    )
+
+
+@router.post("/upload/bundle")
+async def upload_bundle(
+    request: Request, state: AppState = StateDep
+) -> Response:
+    """
+    Receive several small files bundled into one request.
+
+    The X-Bundle-Manifest header carries a JSON array of
+    {transfer_id, filename, size} entries and the body is the files'
+    bytes concatenated in manifest order, so a batch of small files
+    pays one request's overhead instead of one per file. Returns the
+    final record for each file in manifest order.
+    """
+    manifest_header = request.headers.get("X-Bundle-Manifest")
+    if not manifest_header:
+        raise HTTPException(
+            status_code=400,
+            detail="Missing X-Bundle-Manifest header"
+        )
+    try:
+        entries = msgspec.json.decode(
+            manifest_header.encode(), type=list[BundleFileEntry],
+        )
+    except msgspec.ValidationError as exc:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid bundle manifest: {exc}"
+        ) from exc
+    if not entries:
+        raise HTTPException(status_code=400, detail="Empty bundle manifest")
+    declared = sum(e.size for e in entries)
+    if declared > BUNDLE_MAX_BODY_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail="Bundle exceeds maximum size "
+            f"({declared} > {BUNDLE_MAX_BODY_SIZE} bytes)",
+        )
+
+    registry = state.transfers
+    for entry in entries:
+        registry.create(entry.transfer_id, entry.filename)
+    logger.info("Receiving bundle of %d file(s)", len(entries))
+
+    # Bundles are size-capped (client groups, and the declared-size check
+    # above), so buffering the whole body is fine and much simpler than
+    # splitting the stream.
+    body = await request.body()
+    if len(body) != declared:
+        for entry in entries:
+            registry.update(
+                entry.transfer_id,
+                state=TransferState.ERROR,
+                error="Bundle body does not match manifest sizes",
+            )
+        raise HTTPException(
+            status_code=400,
+            detail="Bundle body does not match manifest sizes"
+        )
+
+    bodies = []
+    offset = 0
+    for entry in entries:
+        payload = body[offset:offset + entry.size]
+        offset += entry.size
+        msz_path = f"{state.output_dir_str}/{_stem(entry.filename)}.msz"
+        async with aiofiles.open(msz_path, "wb") as f:
+            await f.write(payload)
+        registry.update(
+            entry.transfer_id,
+            state=TransferState.RECEIVED,
+            bytes_received=entry.size,
+        )
+        response = await state.finalize_upload(
+            state, entry.transfer_id, entry.filename, msz_path, entry.size,
+        )
+        bodies.append(response.body)
+
+    # Each finalizer response is already encoded JSON — join them into
+    # the array without a decode/re-encode round-trip.
+    return Response(
+        content=b"[" + b",".join(bodies) + b"]",
+        media_type="application/json",
+    )
+
+
+def _reject_if_multi_worker(state: AppState) -> None:
+    """Refuse chunked-upload requests when worker processes don't share state."""
+    if state.multi_worker:
+        raise HTTPException(
+            status_code=503,
+            detail="Chunked uploads require a single-worker server; "
+            "run `mstransfer serve --workers 1` or upload without "
+            "--intra-parallel",
+        )
+
+
+@router.post("/upload/{transfer_id}/chunk")
+async def upload_chunk(
+    transfer_id: str,
+    request: Request,
+    offset: int = 0,
+    state: AppState = StateDep,
+) -> dict[str, object]:
+    """
+    Endpoint to receive one byte range of a parallel chunked upload.
+
+    The body is written into the output file at the given offset; ranges
+    from concurrent requests must not overlap. The first chunk for a
+    transfer ID creates the registry record. The client finishes the
+    transfer with POST /upload/{transfer_id}/complete.
+
+    Refused under multi-worker serving: the ranges of one transfer would
+    land in different processes, so no single registry sees the full
+    byte tally and /complete would finalize (and truncate) a partial
+    view of the file.
+    """
+    _reject_if_multi_worker(state)
+    original_filename = request.headers.get("X-Original-Filename")
+    if not original_filename:
+        raise HTTPException(
+            status_code=400,
+            detail="Missing X-Original-Filename header"
+        )
+
+    registry = state.transfers
+    if registry.get(transfer_id) is None:
+        registry.create(transfer_id, original_filename)
+
+    msz_path = f"{state.output_dir_str}/{_stem(original_filename)}.msz"
+    Path(msz_path).touch(exist_ok=True)
+
+    written = 0
+    write_buffer = bytearray()
+    try:
+        async with aiofiles.open(msz_path, "r+b") as f:
+            await f.seek(offset)
+            async for chunk in request.stream():
+                written += len(chunk)
+                if not write_buffer and len(chunk) >= WRITE_COALESCE_SIZE:
+                    await f.write(chunk)
+                    continue
+                write_buffer += chunk
+                if len(write_buffer) >= WRITE_COALESCE_SIZE:
+                    await f.write(write_buffer)
+                    write_buffer.clear()
+            if write_buffer:
+                await f.write(write_buffer)
+    except Exception as exc:
+        registry.update(transfer_id, state=TransferState.ERROR, error=str(exc))
+        raise HTTPException(
+            status_code=500, detail=f"Error receiving data: {exc}"
+        ) from exc
+
+    registry.add_bytes(transfer_id, written)
+    registry.record_extent(transfer_id, offset + written)
+    return {"transfer_id": transfer_id, "received": written}
+
+
+@router.post("/upload/{transfer_id}/complete", response_model=UploadResponse)
+async def upload_complete(
+    transfer_id: str, state: AppState = StateDep
+) -> Response:
+    """
+    Endpoint to finalize a parallel chunked upload once all ranges landed.
+
+    Runs the same post-receive processing (store or decompress) as the
+    single-request upload endpoint.
+    """
+    _reject_if_multi_worker(state)
+    registry = state.transfers
+    record = registry.get(transfer_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Transfer not found")
+
+    msz_path = f"{state.output_dir_str}/{_stem(record.filename)}.msz"
+
+    # Range writes never shrink the file, so a re-upload over a longer
+    # leftover would keep its stale tail — trim to the recorded write
+    # extent. The extent (not the byte tally) is what was provably
+    # written, so a miscounted tally can never truncate real data.
+    extent = registry.get_extent(transfer_id)
+    if extent > 0:
+        with contextlib.suppress(OSError):
+            await asyncio.to_thread(os.truncate, msz_path, extent)
+
+    registry.update(transfer_id, state=TransferState.RECEIVED)
+    logger.info(
+        "Received %s (%d bytes, transfer_id=%s, chunked)",
+        record.filename,
+        record.bytes_received,
+        transfer_id,
+    )
+    return await state.finalize_upload(
+        state, transfer_id, record.filename, msz_path, record.bytes_received,
+    )
+
+
+def _decompress(msz_path: str, mzml_path: str) -> None:
+    """Construct the MSZFile and decompress it, both off the event loop.
+
+    The MSZFile constructor opens the file to read its headers, so it
+    belongs in the worker thread alongside the decompression itself —
+    one thread-pool dispatch instead of two.
+    """
+    MSZFile(msz_path.encode()).decompress(mzml_path)
+
+
+async def _finalize_store_msz(
+    state: AppState,
+    transfer_id: str,
+    original_filename: str,
+    msz_path: str,
+    bytes_received: int,
+) -> Response:
+    """Finalize an upload stored as .msz: just record the final path."""
+    state.transfers.update(
+        transfer_id,
+        state=TransferState.DONE,
+        stored_as=msz_path,
+        bytes_received=bytes_received,
+    )
+    return _upload_response(state, transfer_id)
+
+
+async def _finalize_store_mzml(
+    state: AppState,
+    transfer_id: str,
+    original_filename: str,
+    msz_path: str,
+    bytes_received: int,
+) -> Response:
+    """Finalize an upload stored as .mzML: decompress the received .msz."""
+    registry = state.transfers
+    registry.update(transfer_id, state=TransferState.DECOMPRESSING)
+    try:
+        # Construct the output path for the decompressed .mzML file
+        mzml_path = f"{state.output_dir_str}/{_stem(original_filename)}.mzML"
+
+        # Open and decompress in one thread-pool dispatch — the MSZFile
+        # constructor does file I/O too, so it must not run on the loop.
+        await asyncio.to_thread(_decompress, msz_path, mzml_path)
+
+        # Clean up the original .msz file after successful decompression
+        await aiofiles.os.remove(msz_path)
+
+        # Update the registry with the final state and path to the decompressed file
         registry.update(
             transfer_id,
             state=TransferState.DONE,
-            stored_as=str(msz_path),
+            stored_as=mzml_path,
             bytes_received=bytes_received,
         )
-    elif store_as == "mzml":
-        # If we need to decompress to .mzML, update the state and then
-        # offload the decompression to a thread to avoid blocking the event loop.
-        registry.update(transfer_id, state=TransferState.DECOMPRESSING)
-        try:
-            # Open the .msz file
-            msz_file = MSZFile(str(msz_path).encode())
-
-            # Construct the output path for the decompressed .mzML file
-            mzml_path = output_dir / f"{stem}.mzML"
+        logger.info("Decompressed to %s", mzml_path)
+    except Exception as exc:
+        # On error, update the registry w/ error and log the failure.
+        registry.update(
+            transfer_id,
+            state=TransferState.ERROR,
+            error=str(exc),
+        )
+        logger.error("Decompression failed for %s: %s", transfer_id, exc)
+    return _upload_response(state, transfer_id)
 
-            # Offload decompression to a thread to avoid blocking the event loop
-            await asyncio.to_thread(msz_file.decompress, str(mzml_path))
 
-            # Clean up the original .msz file after successful decompression
-            await aiofiles.os.remove(str(msz_path))
+# The storage mode is fixed for the lifetime of the app, so create_app
+# picks the matching finalizer once and stashes it on AppState — the
+# upload routes never branch on store_as per request.
+FINALIZERS = {
+    "msz": _finalize_store_msz,
+    "mzml": _finalize_store_mzml,
+}
 
-            # Update the registry with the final state and path to the decompressed file
-            registry.update(
-                transfer_id,
-                state=TransferState.DONE,
-                stored_as=str(mzml_path),
-                bytes_received=bytes_received,
-            )
-            logger.info("Decompressed to %s", mzml_path)
-        except Exception as exc:
-            # On error, update the registry w/ error and log the failure.
-            registry.update(
-                transfer_id,
-                state=TransferState.ERROR,
-                error=str(exc),
-            )
-            logger.error("Decompression failed for %s: %s", transfer_id, exc)
 
-    # Return the final transfer record as the response.
-    final = registry.get(transfer_id)
+def _upload_response(state: AppState, transfer_id: str) -> Response:
+    """Build the final upload response from the registry record."""
+    final = state.transfers.get(transfer_id)
 
     # This should not be None,
     #  however if it is, return a 500 error indicating an unexpected state.
@@ -187,10 +633,18 @@ async def upload(
             status_code=500,
             detail="Unexpected error: transfer record missing after processing",
         )
-    return UploadResponse(
-        transfer_id=final.transfer_id,
-        filename=final.filename,
-        stored_as=final.stored_as,
-        state=final.state,
-        bytes_received=final.bytes_received,
+    # Every field comes straight off the registry record, so skip
+    # FastAPI's response_model validation and jsonable_encoder pass and
+    # serialize the trusted data directly with msgspec.
+    return Response(
+        content=msgspec.json.encode(
+            {
+                "transfer_id": final.transfer_id,
+                "filename": final.filename,
+                "stored_as": final.stored_as,
+                "state": final.state.value,
+                "bytes_received": final.bytes_received,
+            }
+        ),
+        media_type="application/json",
     )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import heapq
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from starlette.datastructures import State
@@ -9,38 +11,125 @@ from starlette.datastructures import State
 from mstransfer.server.models import TransferRecord, TransferState
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
     from pathlib import Path
 
+    from fastapi import Response
+
+_TERMINAL_STATES = frozenset({TransferState.DONE, TransferState.ERROR})
+
 
 class AppState(State):
     """Application state object to hold configuration and transfer registry."""
     output_dir: Path
+    output_dir_str: str
     store_as: str
     transfers: TransferRegistry
+    # True when the server runs several uvicorn worker processes. Each
+    # process has its own registry, so routes that accumulate state across
+    # requests (chunked uploads) must refuse to run in this mode.
+    multi_worker: bool
+    # Pool reserved for event-stream waits; see __init__.
+    events_executor: ThreadPoolExecutor
+    # Storage-mode-specialized upload finalizer, assigned by create_app so
+    # the upload routes never branch on store_as per request.
+    finalize_upload: Callable[..., Awaitable[Response]]
 
-    def __init__(self, output_dir: Path, store_as: str) -> None:
+    def __init__(
+        self, output_dir: Path, store_as: str, multi_worker: bool = False,
+    ) -> None:
         super().__init__()
         self.output_dir = output_dir
+        # Cached once so per-request path building is plain string
+        # formatting instead of repeated Path construction/coercion.
+        self.output_dir_str = str(output_dir)
         self.store_as = store_as
+        self.multi_worker = multi_worker
         self.transfers = TransferRegistry()
+        # Each SSE watcher parks a thread in wait_for_change for up to
+        # 15 s per wait; a dedicated pool keeps those parked threads
+        # from occupying the loop's default executor, which serves every
+        # aiofiles write and decompress dispatch. Threads spawn lazily,
+        # so idle apps pay nothing.
+        self.events_executor = ThreadPoolExecutor(
+            max_workers=64, thread_name_prefix="mstransfer-events",
+        )
 
 
 class TransferRegistry:
     """Thread-safe in-memory registry of transfer records."""
 
-    def __init__(self) -> None:
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
         self._records: dict[str, TransferRecord] = {}
         self._lock = threading.Lock()
+        # Injectable monotonic clock so expiry can be driven in tests.
+        self._clock = clock
+        # Min-heap of (terminal-transition time, transfer_id); cleanup()
+        # peeks/pops expired entries instead of scanning every record.
+        self._expiry_heap: list[tuple[float, str]] = []
+        # Condition (sharing the lock) + version counter so event streams can
+        # block until something changes instead of polling.
+        self._changed = threading.Condition(self._lock)
+        self._version = 0
+        # Streamed-byte tallies live outside the records so the per-chunk
+        # hot path never takes the lock; see add_bytes().
+        self._byte_counters: dict[str, list[int]] = {}
+        # Highest byte offset written per transfer, recorded by the
+        # chunked-upload routes; the authoritative size to truncate to.
+        self._extents: dict[str, int] = {}
 
     def create(self, transfer_id: str, filename: str) -> TransferRecord:
         record = TransferRecord(transfer_id=transfer_id, filename=filename)
         with self._lock:
             self._records[transfer_id] = record
+            self._byte_counters[transfer_id] = [0]
+            self._version += 1
+            self._changed.notify_all()
         return record
 
-    def get(self, transfer_id: str) -> TransferRecord | None:
+    def add_bytes(self, transfer_id: str, n: int) -> None:
+        """Add to a transfer's byte tally without taking the lock.
+
+        The += on a one-element list fetched from a dict is a handful of
+        bytecodes, each atomic under the GIL, so streaming loops can call
+        this per chunk with no contention. Readers pick the tally up via
+        `get` / `wait_for_change`; no change notification is sent.
+        """
+        counter = self._byte_counters.get(transfer_id)
+        if counter is not None:
+            counter[0] += n
+
+    def record_extent(self, transfer_id: str, end: int) -> None:
+        """Record that bytes up to offset `end` have been written.
+
+        Unlike the byte tally, the extent is immune to double-counted
+        retries or lost updates inflating it past what is on disk, so
+        it is what chunked completion truncates to. Once per range
+        request, so taking the lock is fine.
+        """
         with self._lock:
-            return self._records.get(transfer_id)
+            if end > self._extents.get(transfer_id, 0):
+                self._extents[transfer_id] = end
+
+    def get_extent(self, transfer_id: str) -> int:
+        """Highest written offset recorded for a transfer (0 if none)."""
+        return self._extents.get(transfer_id, 0)
+
+    def _sync_bytes(self, record: TransferRecord) -> None:
+        counter = self._byte_counters.get(record.transfer_id)
+        if counter is not None and counter[0] > record.bytes_received:
+            record.bytes_received = counter[0]
+
+    def get(self, transfer_id: str) -> TransferRecord | None:
+        # Lockless read path: dict.get is GIL-atomic, and writers only
+        # mutate records field-by-field, so the worst case for a reader is
+        # a slightly torn view of independent fields — acceptable for a
+        # status endpoint, and it keeps concurrent pollers from
+        # serializing against each other and the upload's writes.
+        record = self._records.get(transfer_id)
+        if record is not None:
+            self._sync_bytes(record)
+        return record
 
     def update(self, transfer_id: str, **kwargs: object) -> TransferRecord | None:
         with self._lock:
@@ -49,19 +138,54 @@ class TransferRegistry:
                 return None
             for key, value in kwargs.items():
                 setattr(record, key, value)
+            if "bytes_received" in kwargs:
+                counter = self._byte_counters.get(transfer_id)
+                if counter is not None:
+                    counter[0] = record.bytes_received
+            if kwargs.get("state") in _TERMINAL_STATES:
+                heapq.heappush(self._expiry_heap, (self._clock(), transfer_id))
+            self._version += 1
+            self._changed.notify_all()
             return record
 
+    def wait_for_change(
+        self,
+        transfer_id: str,
+        last_version: int,
+        timeout: float = 15.0,
+    ) -> tuple[TransferRecord | None, int]:
+        """Block until the registry changes past `last_version` (or timeout).
+
+        Returns the current record for `transfer_id` (None if unknown) and
+        the registry version to pass into the next call.  A timeout returns
+        the current state unchanged, which callers can use as a keep-alive.
+        """
+        with self._changed:
+            if self._version == last_version:
+                self._changed.wait(timeout)
+            record = self._records.get(transfer_id)
+            if record is not None:
+                self._sync_bytes(record)
+            return record, self._version
+
     def cleanup(self, max_age_seconds: float = 300) -> int:
-        """Remove old completed/errored records. Returns count removed."""
-        now = time.time()
-        terminal = {TransferState.DONE, TransferState.ERROR}
-        to_remove: list[str] = []
+        """Remove old completed/errored records. Returns count removed.
+
+        Expiry candidates come off the heap populated by `update` when a
+        transfer reaches a terminal state, so a sweep only touches the
+        entries that are actually due — no per-record age scan. Age is
+        measured from the terminal transition, not record creation.
+        """
+        cutoff = self._clock() - max_age_seconds
+        heap = self._expiry_heap
+        removed = 0
         with self._lock:
-            for tid, record in self._records.items():
-                if record.state in terminal:
-                    age = now - record.created_at.timestamp()
-                    if age > max_age_seconds:
-                        to_remove.append(tid)
-            for tid in to_remove:
-                del self._records[tid]
-        return len(to_remove)
+            while heap and heap[0][0] <= cutoff:
+                _, tid = heapq.heappop(heap)
+                record = self._records.get(tid)
+                if record is not None and record.state in _TERMINAL_STATES:
+                    del self._records[tid]
+                    self._byte_counters.pop(tid, None)
+                    self._extents.pop(tid, None)
+                    removed += 1
+        return removed
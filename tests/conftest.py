@@ -1,35 +1,135 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import json
+import mmap
+import sys
 import tarfile
 from pathlib import Path
 
 import httpx
 import pytest
+import zstandard
+from mscompress import MZMLFile
 
 from mstransfer.server.app import create_app
+from mstransfer.server.state import TransferRegistry
 
 DATA_DIR = Path(__file__).parent / "data"
 
 
-@pytest.fixture()
-def test_mzml() -> Path:
-    """Path to the real test.mzML file."""
-    return DATA_DIR / "test.mzML"
+if sys.platform != "win32":
+    import uvloop
 
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop, the loop the server ships with.
 
-@pytest.fixture()
+        uvicorn[standard] already pulls uvloop in, so tests exercise the
+        same event loop as production and shave per-await overhead.
+        """
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def test_mzml(tmp_path_factory) -> Path:
+    """Path to the real test.mzML file, decompressed once per session.
+
+    The fixture is checked in as test.mzML.zst (~0.7 MB vs ~4.9 MB
+    plain) to keep the repo and clones small; one streaming zstd
+    decompression at session start rebuilds it.
+    """
+    out = tmp_path_factory.mktemp("mzml") / "test.mzML"
+    with open(DATA_DIR / "test.mzML.zst", "rb") as src, open(out, "wb") as dst:
+        zstandard.ZstdDecompressor().copy_stream(
+            src, dst, read_size=1 << 20, write_size=1 << 20,
+        )
+    return out
+
+
+@pytest.fixture(scope="session")
 def test_msz() -> Path:
     """Path to the real test.msz file."""
     return DATA_DIR / "test.msz"
 
 
-@pytest.fixture()
-def test_mszx(tmp_path) -> Path:
-    """Build a minimal .mszx archive from the real test.msz file."""
+@pytest.fixture(scope="session")
+def test_mzml_size(test_mzml) -> int:
+    """Size of test.mzML in bytes, stat'ed once for the session."""
+    return test_mzml.stat().st_size
+
+
+@pytest.fixture(scope="session")
+def test_msz_size(test_msz) -> int:
+    """Size of test.msz in bytes, stat'ed once for the session."""
+    return test_msz.stat().st_size
+
+
+@pytest.fixture(scope="session")
+def msz_payload(test_msz) -> bytes:
+    """The test.msz bytes, read from disk once for the whole session."""
+    return test_msz.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def msz_payload_mv(test_msz):
+    """Zero-copy memoryview of test.msz, backed by an mmap of the file.
+
+    Shares the kernel page cache instead of allocating a bytes copy.
+    httpx iterates a bare memoryview into ints, so tests must feed this
+    through a chunking adapter rather than passing it as content=.
+    """
+    with open(test_msz, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mm)
+    yield view
+    view.release()
+    mm.close()
+
+
+@pytest.fixture(scope="session")
+def msz_payload_sha256(msz_payload) -> bytes:
+    """SHA-256 digest of the test.msz bytes, computed once per session."""
+    return hashlib.sha256(msz_payload).digest()
+
+
+@pytest.fixture(scope="session")
+def mzml_file(test_mzml) -> MZMLFile:
+    """One MZMLFile over test.mzML for the whole session.
+
+    Construction loads the native library state and allocates the zstd
+    context, so tests share an instance. compress_stream is restartable
+    (each call re-reads the file), but the object is not shared across
+    threads within a single test.
+    """
+    return MZMLFile(str(test_mzml).encode())
+
+
+@pytest.fixture(scope="session")
+def compressed_mzml_bytes(mzml_file) -> bytes:
+    """test.mzML compressed to msz bytes, computed once for the session.
+
+    The zstd compression is CPU-bound, so tests that simulate a sender
+    streaming compressed output share this instead of recompressing.
+    """
+    mzml = mzml_file
+    # Accumulate into one growing buffer rather than b"".join over a list
+    # of chunks, which would hold every chunk plus the joined copy at peak.
+    buf = bytearray()
+    for chunk in mzml.compress_stream(chunk_size=1_048_576):
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+@pytest.fixture(scope="session")
+def test_mszx(tmp_path_factory) -> Path:
+    """Build a minimal .mszx archive from the real test.msz file.
+
+    Session-scoped: tests only ever read the archive, so one build
+    serves the whole run.
+    """
     msz_src = DATA_DIR / "test.msz"
-    mszx_path = tmp_path / "test.mszx"
+    mszx_path = tmp_path_factory.mktemp("mszx") / "test.mszx"
 
     manifest = json.dumps({
         "version": "1.0",
@@ -56,30 +156,65 @@ def tmp_output(tmp_path):
     return d
 
 
+# The apps and their ASGI clients are built once per session — the
+# FastAPI route table and httpx client setup are not free — and reset
+# per test below by swapping in a fresh registry and output directory.
+
+
+def _session_app_and_client(tmp_path_factory, store_as: str):
+    app = create_app(
+        output_dir=str(tmp_path_factory.mktemp(f"{store_as}_app")),
+        store_as=store_as,
+    )
+    transport = httpx.ASGITransport(app=app)
+    client = httpx.AsyncClient(transport=transport, base_url="http://test")
+    return app, client
+
+
+def _reset_app(app, output_dir: Path) -> None:
+    """Point a shared app at a fresh output dir with an empty registry."""
+    state = app.state
+    state.output_dir = output_dir
+    state.output_dir_str = str(output_dir)
+    state.transfers = TransferRegistry()
+
+
+@pytest.fixture(scope="session")
+def _msz_session(tmp_path_factory):
+    return _session_app_and_client(tmp_path_factory, "msz")
+
+
+@pytest.fixture(scope="session")
+def _mzml_session(tmp_path_factory):
+    return _session_app_and_client(tmp_path_factory, "mzml")
+
+
 @pytest.fixture()
-def msz_app(tmp_output):
-    """FastAPI app configured to store as MSZ."""
-    return create_app(output_dir=str(tmp_output), store_as="msz")
+def msz_app(_msz_session, tmp_output):
+    """FastAPI app configured to store as MSZ, reset for this test."""
+    app, _ = _msz_session
+    _reset_app(app, tmp_output)
+    return app
 
 
 @pytest.fixture()
-def mzml_app(tmp_output):
-    """FastAPI app configured to store as mzML."""
-    return create_app(output_dir=str(tmp_output), store_as="mzml")
+def mzml_app(_mzml_session, tmp_output):
+    """FastAPI app configured to store as mzML, reset for this test."""
+    app, _ = _mzml_session
+    _reset_app(app, tmp_output)
+    return app
 
 
 @pytest.fixture()
-def msz_client(msz_app):
+def msz_client(msz_app, _msz_session):
     """httpx AsyncClient wired to the msz app via ASGI transport."""
-    transport = httpx.ASGITransport(app=msz_app)
-    return httpx.AsyncClient(transport=transport, base_url="http://test")
+    return _msz_session[1]
 
 
 @pytest.fixture()
-def mzml_client(mzml_app):
+def mzml_client(mzml_app, _mzml_session):
     """httpx AsyncClient wired to the mzml app via ASGI transport."""
-    transport = httpx.ASGITransport(app=mzml_app)
-    return httpx.AsyncClient(transport=transport, base_url="http://test")
+    return _mzml_session[1]
 
 
 @pytest.fixture()
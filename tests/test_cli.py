@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import socket
 import sys
 from pathlib import Path
@@ -13,6 +14,7 @@ import pytest
 
 from mstransfer.cli import (
     UploadProgressDisplay,
+    check_server,
     cmd_serve,
     cmd_upload,
     main,
@@ -126,6 +128,7 @@ class TestCmdServe:
             "port": 1319,
             "output_dir": "./received",
             "store_as": "msz",
+            "workers": 1,
         }
         defaults.update(overrides)
         return argparse.Namespace(**defaults)
@@ -140,7 +143,7 @@ class TestCmdServe:
         cmd_serve(args)
 
         mock_create_app.assert_called_once_with(
-            output_dir="./received", store_as="msz",
+            output_dir="./received", store_as="msz", api_key=None,
         )
         mock_run.assert_called_once_with(
             mock_app, host="0.0.0.0", port=1319, log_level="warning",
@@ -154,13 +157,43 @@ class TestCmdServe:
         )
         cmd_serve(args)
         mock_create_app.assert_called_once_with(
-            output_dir="/tmp/out", store_as="mzml",
+            output_dir="/tmp/out", store_as="mzml", api_key=None,
         )
         mock_run.assert_called_once_with(
             mock_create_app.return_value,
             host="127.0.0.1", port=9999, log_level="warning",
         )
 
+    @patch("mstransfer.cli.uvicorn.run")
+    def test_serve_multiworker_uses_factory(self, mock_run):
+        """workers > 1 switches to the import-string factory + env config."""
+        args = self._make_args(workers=4, output_dir="/tmp/out", store_as="mzml")
+        try:
+            cmd_serve(args)
+            pos, kwargs = mock_run.call_args
+            assert pos[0] == "mstransfer.server.app:create_app_from_env"
+            assert kwargs["factory"] is True
+            assert kwargs["workers"] == 4
+            assert os.environ["MSTRANSFER_OUTPUT_DIR"] == "/tmp/out"
+            assert os.environ["MSTRANSFER_STORE_AS"] == "mzml"
+            assert os.environ["MSTRANSFER_WORKERS"] == "4"
+        finally:
+            os.environ.pop("MSTRANSFER_OUTPUT_DIR", None)
+            os.environ.pop("MSTRANSFER_STORE_AS", None)
+            os.environ.pop("MSTRANSFER_WORKERS", None)
+
+    @patch("mstransfer.cli.uvicorn.run")
+    @patch("mstransfer.cli.create_app")
+    def test_serve_single_worker_honors_api_key_env(
+        self, mock_create_app, mock_run, monkeypatch,
+    ):
+        """MSTRANSFER_API_KEY must enable auth regardless of worker count."""
+        monkeypatch.setenv("MSTRANSFER_API_KEY", "sekret")
+        cmd_serve(self._make_args())
+        mock_create_app.assert_called_once_with(
+            output_dir="./received", store_as="msz", api_key="sekret",
+        )
+
     def test_serve_port_in_use_exits(self):
         """If the port is already bound, cmd_serve should exit with code 1."""
         # Bind a port so it's "in use"
@@ -173,6 +206,37 @@ class TestCmdServe:
                 cmd_serve(args)
 
 
+# ---------------------------------------------------------------------------
+# check_server tests
+# ---------------------------------------------------------------------------
+
+
+class TestCheckServer:
+    def test_ok_first_try(self):
+        client = MagicMock()
+        client.head.return_value = MagicMock(status_code=200)
+        check_server(client, "http://host:1319")
+        client.head.assert_called_once_with("http://host:1319/v1/health", timeout=5.0)
+
+    @patch("mstransfer.cli.time.sleep")
+    def test_retries_on_503_with_retry_after(self, mock_sleep):
+        client = MagicMock()
+        busy = MagicMock(status_code=503, headers={"Retry-After": "0.25"})
+        ok = MagicMock(status_code=200)
+        client.head.side_effect = [busy, ok]
+        check_server(client, "http://host:1319")
+        assert client.head.call_count == 2
+        mock_sleep.assert_called_once_with(0.25)
+
+    @patch("mstransfer.cli.time.sleep")
+    def test_gives_up_after_attempts(self, mock_sleep):
+        client = MagicMock()
+        client.head.side_effect = httpx.ConnectError("refused")
+        with pytest.raises(SystemExit, match="1"):
+            check_server(client, "http://host:1319")
+        assert client.head.call_count == 3
+
+
 # ---------------------------------------------------------------------------
 # cmd_upload tests
 # ---------------------------------------------------------------------------
@@ -185,6 +249,9 @@ class TestCmdUpload:
             "recursive": False,
             "parallel": 4,
             "chunk_size": 1_048_576,
+            "adaptive_chunk_size": False,
+            "intra_parallel": 1,
+            "tcp_tuning": False,
         }
         defaults.update(overrides)
         return argparse.Namespace(**defaults)
@@ -204,15 +271,16 @@ class TestCmdUpload:
         with pytest.raises(SystemExit, match="1"):
             cmd_upload(args)
 
+    @patch("mstransfer.cli.time.sleep")
     @patch(
         "mstransfer.cli.resolve_inputs",
         return_value=[Path("/data/a.mzML")],
     )
-    @patch(
-        "mstransfer.cli.httpx.get",
-        side_effect=httpx.ConnectError("refused"),
-    )
-    def test_healthcheck_connect_error_exits(self, _mock_get, _mock_resolve):
+    @patch("mstransfer.cli.httpx.Client")
+    def test_healthcheck_connect_error_exits(
+        self, mock_client_cls, _mock_resolve, _mock_sleep,
+    ):
+        mock_client_cls.return_value.head.side_effect = httpx.ConnectError("refused")
         args = self._make_args(["/data/a.mzML", "badhost:1319"])
         with pytest.raises(SystemExit, match="1"):
             cmd_upload(args)
@@ -221,22 +289,22 @@ class TestCmdUpload:
         "mstransfer.cli.resolve_inputs",
         return_value=[Path("/data/a.mzML")],
     )
-    @patch(
-        "mstransfer.cli.httpx.get",
-        side_effect=httpx.TimeoutException("timeout"),
-    )
-    def test_healthcheck_timeout_exits(self, _mock_get, _mock_resolve):
+    @patch("mstransfer.cli.httpx.Client")
+    def test_healthcheck_timeout_exits(self, mock_client_cls, _mock_resolve):
+        mock_client_cls.return_value.head.side_effect = httpx.TimeoutException(
+            "timeout",
+        )
         args = self._make_args(["/data/a.mzML", "slowhost:1319"])
         with pytest.raises(SystemExit, match="1"):
             cmd_upload(args)
 
     @patch("mstransfer.cli.send_batch")
-    @patch("mstransfer.cli.httpx.get")
+    @patch("mstransfer.cli.httpx.Client")
     @patch("mstransfer.cli.resolve_inputs")
-    def test_successful_upload(self, mock_resolve, mock_get, mock_send_batch):
+    def test_successful_upload(self, mock_resolve, mock_client_cls, mock_send_batch):
         files = [Path("/data/a.mzML"), Path("/data/b.msz")]
         mock_resolve.return_value = files
-        mock_get.return_value = MagicMock(status_code=200)
+        mock_client_cls.return_value.head.return_value = MagicMock(status_code=200)
         mock_send_batch.return_value = [
             FileResult(
                 filename="a.mzML",
@@ -262,15 +330,17 @@ class TestCmdUpload:
         call_kwargs = mock_send_batch.call_args
         assert call_kwargs[0][0] == files
         assert call_kwargs[0][1] == "http://myhost:1319"
+        # The health-check client is shared with the batch uploads.
+        assert call_kwargs[1]["client"] is mock_client_cls.return_value
 
     @patch("mstransfer.cli.send_batch")
-    @patch("mstransfer.cli.httpx.get")
+    @patch("mstransfer.cli.httpx.Client")
     @patch("mstransfer.cli.resolve_inputs")
     def test_partial_failure_prints_errors(
-        self, mock_resolve, mock_get, mock_send_batch,
+        self, mock_resolve, mock_client_cls, mock_send_batch,
     ):
         mock_resolve.return_value = [Path("/data/a.mzML"), Path("/data/b.msz")]
-        mock_get.return_value = MagicMock(status_code=200)
+        mock_client_cls.return_value.head.return_value = MagicMock(status_code=200)
         mock_send_batch.return_value = [
             FileResult(
                 filename="a.mzML",
@@ -287,13 +357,13 @@ class TestCmdUpload:
         cmd_upload(args)
 
     @patch("mstransfer.cli.send_batch")
-    @patch("mstransfer.cli.httpx.get")
+    @patch("mstransfer.cli.httpx.Client")
     @patch("mstransfer.cli.resolve_inputs")
     def test_upload_passes_parallel_and_chunk_size(
-        self, mock_resolve, mock_get, mock_send_batch,
+        self, mock_resolve, mock_client_cls, mock_send_batch,
     ):
         mock_resolve.return_value = [Path("/data/a.mzML")]
-        mock_get.return_value = MagicMock(status_code=200)
+        mock_client_cls.return_value.head.return_value = MagicMock(status_code=200)
         mock_send_batch.return_value = [
             FileResult(
                 filename="a.mzML",
@@ -314,12 +384,14 @@ class TestCmdUpload:
         assert kwargs["chunk_size"] == 4_194_304
 
     @patch("mstransfer.cli.send_batch")
-    @patch("mstransfer.cli.httpx.get")
+    @patch("mstransfer.cli.httpx.Client")
     @patch("mstransfer.cli.resolve_inputs")
-    def test_upload_error_response_state(self, mock_resolve, mock_get, mock_send_batch):
+    def test_upload_error_response_state(
+        self, mock_resolve, mock_client_cls, mock_send_batch,
+    ):
         """A file that has a response but with ERROR state is counted as failure."""
         mock_resolve.return_value = [Path("/data/a.mzML")]
-        mock_get.return_value = MagicMock(status_code=200)
+        mock_client_cls.return_value.head.return_value = MagicMock(status_code=200)
         mock_send_batch.return_value = [
             FileResult(
                 filename="a.mzML",
@@ -350,11 +422,26 @@ class TestUploadProgressDisplay:
         assert task.description == "a.mzML"
         assert task.total == 1000
 
-    def test_file_progress_advances(self):
+    def test_file_progress_advances_after_refresh(self):
         display = UploadProgressDisplay(total_files=1)
         display.file_started(0, Path("/data/a.mzML"), total_bytes=1000)
         display.file_progress(0, 500)
 
+        # Worker threads only bump the counter; refresh pushes it to Rich.
+        task = display.files.tasks[display._task_ids[0]]
+        assert task.completed == 0
+        display.refresh()
+        assert task.completed == 500
+
+    def test_refresh_reports_only_new_bytes(self):
+        display = UploadProgressDisplay(total_files=1)
+        display.file_started(0, Path("/data/a.mzML"), total_bytes=1000)
+        display.file_progress(0, 300)
+        display.refresh()
+        display.refresh()  # no new bytes — must not double-count
+        display.file_progress(0, 200)
+        display.refresh()
+
         task = display.files.tasks[display._task_ids[0]]
         assert task.completed == 500
 
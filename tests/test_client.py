@@ -2,24 +2,50 @@
 
 from __future__ import annotations
 
+import filecmp
+import os
+import shutil
 import threading
-import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import httpx
+import msgspec
 import pytest
 import uvicorn
-from mscompress import MSZFile, MZMLFile
+from mscompress import MSZFile
 from mscompress.mszx import MSZXFile
 
 from mstransfer.client.sender import (
+    _BUNDLE_MAX_TOTAL_SIZE,
+    _adaptive_chunk_generator,
+    _bundle_groups,
+    _ConcurrencyController,
     _counting_generator,
     _file_chunk_generator,
+    _pipelined_iterator,
+    _poll_status,
+    _ProgressFileReader,
+    _ThrottledCallback,
     resolve_inputs,
     send_batch,
     send_file,
+    tcp_tuned_transport,
 )
+from mstransfer.client.sender_async import send_batch_async, send_file_async
 from mstransfer.server.app import create_app
+from mstransfer.server.models import TransferRecord, TransferState
+
+
+def _stage_copy(src, dest) -> None:
+    """Stage a fixture copy via hardlink — zero bytes moved through
+    userspace; falls back to a real copy on filesystems without links."""
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
 
 # ---------------------------------------------------------------------------
 # resolve_inputs
@@ -82,6 +108,22 @@ class TestResolveInputs:
         result = resolve_inputs([str(sample_files), str(sample_files)], recursive=True)
         assert len(result) == len(set(result))
 
+    def test_unreadable_subdir_skipped(self, tmp_path):
+        """A PermissionError in one subdirectory doesn't abort the scan."""
+        (tmp_path / "ok.msz").touch()
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if str(path) == str(locked):
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        with patch("mstransfer.client.sender.os.scandir", side_effect=scandir):
+            result = resolve_inputs([str(tmp_path)], recursive=True)
+        assert result == [tmp_path / "ok.msz"]
+
 
 # ---------------------------------------------------------------------------
 # _counting_generator
@@ -106,6 +148,45 @@ class TestCountingGenerator:
         assert result == chunks
 
 
+# ---------------------------------------------------------------------------
+# _pipelined_iterator
+# ---------------------------------------------------------------------------
+
+
+class TestPipelinedIterator:
+    def test_yields_all_chunks_in_order(self):
+        chunks = [b"aaa", b"bb", b"c"]
+        assert list(_pipelined_iterator(iter(chunks))) == chunks
+
+    def test_empty_iterator(self):
+        assert list(_pipelined_iterator(iter([]))) == []
+
+    def test_propagates_producer_exception(self):
+        def broken():
+            yield b"ok"
+            raise ValueError("compressor failed")
+
+        it = _pipelined_iterator(broken())
+        assert next(it) == b"ok"
+        with pytest.raises(ValueError, match="compressor failed"):
+            list(it)
+
+    def test_early_close_unblocks_producer(self):
+        """Abandoning the generator mid-stream must not leak the thread."""
+        def endless():
+            while True:
+                yield b"x" * 16
+
+        before = set(threading.enumerate())
+        it = _pipelined_iterator(endless(), depth=2)
+        assert next(it) == b"x" * 16
+        it.close()
+        for thread in threading.enumerate():
+            if thread not in before:
+                thread.join(timeout=2.0)
+                assert not thread.is_alive()
+
+
 # ---------------------------------------------------------------------------
 # _file_chunk_generator
 # ---------------------------------------------------------------------------
@@ -116,16 +197,23 @@ class TestFileChunkGenerator:
         f = tmp_path / "data.bin"
         content = b"x" * 100
         f.write_bytes(content)
-        result = b"".join(_file_chunk_generator(f, chunk_size=1024))
-        assert result == content
+        result = bytearray()
+        for chunk in _file_chunk_generator(f, chunk_size=1024):
+            result += chunk
+        assert bytes(result) == content
 
     def test_chunked_reads(self, tmp_path):
         f = tmp_path / "data.bin"
         content = b"abcdefghij"
         f.write_bytes(content)
-        chunks = list(_file_chunk_generator(f, chunk_size=3))
-        assert len(chunks) == 4  # 3+3+3+1
-        assert b"".join(chunks) == content
+        # Chunks are views over pooled buffers — consume them as they come.
+        result = bytearray()
+        count = 0
+        for chunk in _file_chunk_generator(f, chunk_size=3):
+            result += chunk
+            count += 1
+        assert count == 4  # 3+3+3+1
+        assert bytes(result) == content
 
     def test_callback_reports_sizes(self, tmp_path):
         f = tmp_path / "data.bin"
@@ -135,73 +223,289 @@ class TestFileChunkGenerator:
         assert sizes == [4, 4, 2]
 
 
+# ---------------------------------------------------------------------------
+# _poll_status
+# ---------------------------------------------------------------------------
+
+
+class TestPollStatus:
+    def test_plaintext_state_endpoint(self):
+        done = MagicMock(status_code=200, text="done 1024\n")
+        client = MagicMock()
+        client.get.return_value = done
+        state = _poll_status(client, "http://host:1319", "t1", timeout=5.0)
+        assert state == TransferState.DONE
+
+    def test_falls_back_to_status_on_404(self):
+        """Servers without /state (pre-plaintext) still serve /status."""
+        record = TransferRecord(
+            transfer_id="t1", filename="f.msz", state=TransferState.DONE,
+        )
+        done = MagicMock(status_code=200, content=msgspec.json.encode(record))
+        client = MagicMock()
+        client.get.side_effect = [MagicMock(status_code=404), done]
+        state = _poll_status(client, "http://host:1319", "t1", timeout=5.0)
+        assert state == TransferState.DONE
+        urls = [call.args[0] for call in client.get.call_args_list]
+        assert urls == [
+            "http://host:1319/v1/transfer/t1/state",
+            "http://host:1319/v1/transfer/t1/status",
+        ]
+
+
+# ---------------------------------------------------------------------------
+# _bundle_groups
+# ---------------------------------------------------------------------------
+
+
+class TestBundleGroups:
+    def test_all_fit_in_one_group(self):
+        small = [(0, 1024), (1, 2048), (2, 4096)]
+        assert _bundle_groups(small) == [[0, 1, 2]]
+
+    def test_splits_at_total_size_cap(self):
+        half = _BUNDLE_MAX_TOTAL_SIZE // 2
+        small = [(0, half), (1, half), (2, half)]
+        assert _bundle_groups(small) == [[0, 1], [2]]
+
+    def test_oversized_entry_gets_own_group(self):
+        small = [(0, 16), (1, _BUNDLE_MAX_TOTAL_SIZE + 1), (2, 16)]
+        assert _bundle_groups(small) == [[0], [1], [2]]
+
+    def test_empty_input(self):
+        assert _bundle_groups([]) == []
+
+
+# ---------------------------------------------------------------------------
+# _ConcurrencyController
+# ---------------------------------------------------------------------------
+
+
+class TestConcurrencyController:
+    def test_starts_at_maximum(self):
+        ctl = _ConcurrencyController(4)
+        assert ctl.target == 4
+
+    def test_backs_off_after_two_decelerating_samples(self):
+        ctl = _ConcurrencyController(4)
+        ctl.record(1000, 1.0)
+        ctl.record(500, 1.0)
+        assert ctl.target == 4  # one slowdown is tolerated
+        ctl.record(250, 1.0)
+        assert ctl.target == 2
+
+    def test_recovers_toward_maximum(self):
+        ctl = _ConcurrencyController(4)
+        ctl.record(1000, 1.0)
+        ctl.record(500, 1.0)
+        ctl.record(250, 1.0)
+        assert ctl.target == 2
+        ctl.record(1000, 1.0)
+        assert ctl.target == 3
+
+    def test_never_drops_below_one(self):
+        ctl = _ConcurrencyController(2)
+        rate = 1024.0
+        for _ in range(10):
+            ctl.record(int(rate), 1.0)
+            rate /= 2  # sustained decline
+        assert ctl.target == 1
+
+    def test_mixed_rates_do_not_ratchet_down(self):
+        """Alternating fast .msz / slow .mzML samples are not congestion."""
+        ctl = _ConcurrencyController(4)
+        for _ in range(10):
+            ctl.record(1000, 1.0)
+            ctl.record(100, 1.0)  # slow class, but steady
+        assert ctl.target == 4
+
+    def test_ignores_empty_samples(self):
+        ctl = _ConcurrencyController(2)
+        ctl.record(0, 1.0)
+        ctl.record(100, 0.0)
+        assert ctl.target == 2
+
+
+# ---------------------------------------------------------------------------
+# _ThrottledCallback
+# ---------------------------------------------------------------------------
+
+
+class TestThrottledCallback:
+    def test_accumulates_below_thresholds(self):
+        deltas = []
+        cb = _ThrottledCallback(deltas.append, min_bytes=100, min_interval=60.0)
+        cb(10)
+        cb(20)
+        assert deltas == []
+
+    def test_flushes_on_byte_threshold(self):
+        deltas = []
+        cb = _ThrottledCallback(deltas.append, min_bytes=100, min_interval=60.0)
+        cb(60)
+        cb(60)
+        assert deltas == [120]
+
+    def test_flush_delivers_remainder(self):
+        deltas = []
+        cb = _ThrottledCallback(deltas.append, min_bytes=100, min_interval=60.0)
+        cb(30)
+        cb.flush()
+        assert deltas == [30]
+        cb.flush()  # nothing pending — no extra callback
+        assert deltas == [30]
+
+    def test_total_bytes_preserved(self):
+        deltas = []
+        cb = _ThrottledCallback(deltas.append, min_bytes=64, min_interval=60.0)
+        for _ in range(10):
+            cb(25)
+        cb.flush()
+        assert sum(deltas) == 250
+
+
+# ---------------------------------------------------------------------------
+# _adaptive_chunk_generator
+# ---------------------------------------------------------------------------
+
+
+class TestAdaptiveChunkGenerator:
+    def test_reads_full_file(self, tmp_path):
+        f = tmp_path / "data.bin"
+        content = b"x" * 10_000
+        f.write_bytes(content)
+        result = b"".join(_adaptive_chunk_generator(f, chunk_size=1024))
+        assert result == content
+
+    def test_callback_reports_all_bytes(self, tmp_path):
+        f = tmp_path / "data.bin"
+        f.write_bytes(b"y" * 5000)
+        sizes = []
+        list(_adaptive_chunk_generator(f, chunk_size=512, callback=sizes.append))
+        assert sum(sizes) == 5000
+
+    def test_send_file_adaptive(self, test_msz, _live_server, test_msz_size):
+        """send_file with adaptive chunking still transfers the full file."""
+        result = send_file(
+            test_msz,
+            _live_server["base_url"],
+            chunk_size=512,
+            adaptive_chunk_size=True,
+        )
+        assert result.state == "done"
+        assert result.bytes_received == test_msz_size
+
+
+# ---------------------------------------------------------------------------
+# _ProgressFileReader
+# ---------------------------------------------------------------------------
+
+
+class TestProgressFileReader:
+    def test_reads_full_file(self, tmp_path):
+        f = tmp_path / "data.bin"
+        content = b"x" * 100
+        f.write_bytes(content)
+        reader = _ProgressFileReader(f)
+        try:
+            assert reader.read() == content
+        finally:
+            reader.close()
+
+    def test_callback_reports_sizes(self, tmp_path):
+        f = tmp_path / "data.bin"
+        f.write_bytes(b"abcdefghij")
+        sizes = []
+        reader = _ProgressFileReader(f, callback=sizes.append)
+        try:
+            while reader.read(4):
+                pass
+        finally:
+            reader.close()
+        assert sizes == [4, 4, 2]
+
+
 # ---------------------------------------------------------------------------
 # send_file (integration with real server + real mscompress files)
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def _live_server(tmp_path):
-    """Start a real mstransfer server on a free port in a background thread."""
-    output_dir = tmp_path / "server_output"
-    output_dir.mkdir()
-    app = create_app(output_dir=str(output_dir), store_as="msz")
+class _ReadyServer(uvicorn.Server):
+    """uvicorn.Server that signals an Event once its socket is bound."""
+
+    def __init__(self, config: uvicorn.Config) -> None:
+        super().__init__(config)
+        self.ready = threading.Event()
+
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets=sockets)
+        self.ready.set()
 
+
+def _start_live_server(output_dir, store_as):
+    """Start a real mstransfer server on a free port in a background thread."""
+    app = create_app(output_dir=str(output_dir), store_as=store_as)
     config = uvicorn.Config(app, host="127.0.0.1", port=0, log_level="error")
-    server = uvicorn.Server(config)
+    server = _ReadyServer(config)
 
     thread = threading.Thread(target=server.run, daemon=True)
     thread.start()
 
-    # Wait for server to be ready
-    for _ in range(50):
-        if server.started:
-            break
-        time.sleep(0.1)
-    else:
+    # Block on the startup event instead of sleep-polling.
+    if not server.ready.wait(timeout=5):
         raise RuntimeError("Server did not start in time")
 
     # Extract the actual bound port
-    sockets = server.servers[0].sockets
-    port = sockets[0].getsockname()[1]
+    port = server.servers[0].sockets[0].getsockname()[1]
+    return server, thread, f"http://127.0.0.1:{port}"
 
-    yield {"base_url": f"http://127.0.0.1:{port}", "output_dir": output_dir}
 
-    server.should_exit = True
-    thread.join(timeout=5)
+# Module-scoped so uvicorn boots once per mode for the whole file instead
+# of once per test; every test writes/reads distinct enough outputs that
+# sharing the output directory is safe.
+@pytest.fixture(scope="module")
+def _live_server(tmp_path_factory):
+    """One shared mstransfer server in msz mode."""
+    output_dir = tmp_path_factory.mktemp("server_output")
+    server, thread, base_url = _start_live_server(output_dir, "msz")
 
+    yield {"base_url": base_url, "output_dir": output_dir}
 
-@pytest.fixture()
-def _live_server_mzml(tmp_path):
-    """Start a real mstransfer server in mzml mode."""
-    output_dir = tmp_path / "server_output_mzml"
-    output_dir.mkdir()
-    app = create_app(output_dir=str(output_dir), store_as="mzml")
+    # force_exit skips uvicorn's graceful connection drain — nothing is
+    # in flight once the module's tests are done.
+    server.should_exit = True
+    server.force_exit = True
+    thread.join(timeout=1)
 
-    config = uvicorn.Config(app, host="127.0.0.1", port=0, log_level="error")
-    server = uvicorn.Server(config)
 
-    thread = threading.Thread(target=server.run, daemon=True)
-    thread.start()
+@pytest.fixture(scope="module")
+def _live_server_mzml(tmp_path_factory):
+    """One shared mstransfer server in mzml mode."""
+    output_dir = tmp_path_factory.mktemp("server_output_mzml")
+    server, thread, base_url = _start_live_server(output_dir, "mzml")
 
-    for _ in range(50):
-        if server.started:
-            break
-        time.sleep(0.1)
-    else:
-        raise RuntimeError("Server did not start in time")
+    yield {"base_url": base_url, "output_dir": output_dir}
 
-    sockets = server.servers[0].sockets
-    port = sockets[0].getsockname()[1]
+    # force_exit skips uvicorn's graceful connection drain — nothing is
+    # in flight once the module's tests are done.
+    server.should_exit = True
+    server.force_exit = True
+    thread.join(timeout=1)
 
-    yield {"base_url": f"http://127.0.0.1:{port}", "output_dir": output_dir}
 
-    server.should_exit = True
-    thread.join(timeout=5)
+class TestTcpTunedTransport:
+    def test_builds_http_transport(self):
+        assert isinstance(tcp_tuned_transport(), httpx.HTTPTransport)
+
+    def test_upload_over_tuned_transport(self, test_msz, _live_server, test_msz_size):
+        with httpx.Client(transport=tcp_tuned_transport(), timeout=30.0) as client:
+            result = send_file(test_msz, _live_server["base_url"], client=client)
+        assert result.state == "done"
+        assert result.bytes_received == test_msz_size
 
 
 class TestSendFile:
-    def test_send_msz_file(self, test_msz, _live_server):
+    def test_send_msz_file(self, test_msz, _live_server, test_msz_size):
         """Send a real .msz file to the server."""
         result = send_file(
             test_msz,
@@ -209,11 +513,18 @@ class TestSendFile:
         )
         assert result.state == "done"
         assert result.filename == "test.msz"
-        assert result.bytes_received == test_msz.stat().st_size
+        assert result.bytes_received == test_msz_size
 
         written = _live_server["output_dir"] / "test.msz"
         assert written.exists()
-        assert written.read_bytes() == test_msz.read_bytes()
+        assert filecmp.cmp(test_msz, written, shallow=False)
+
+    def test_known_suffix_skips_detection(self, test_msz, _live_server):
+        """Recognized suffixes are trusted without sniffing the header."""
+        with patch("mstransfer.client.sender.detect_filetype") as mock_detect:
+            result = send_file(test_msz, _live_server["base_url"])
+        mock_detect.assert_not_called()
+        assert result.state == "done"
 
     def test_send_mzml_file(self, test_mzml, _live_server):
         """Send a real .mzML file — sender compresses on the fly."""
@@ -230,7 +541,9 @@ class TestSendFile:
         assert written.exists()
         assert written.stat().st_size > 0
 
-    def test_send_mzml_file_server_decompresses(self, test_mzml, _live_server_mzml):
+    def test_send_mzml_file_server_decompresses(
+        self, test_mzml, _live_server_mzml, test_mzml_size,
+    ):
         """Send .mzML → server compresses to msz in transit, decompresses back."""
         result = send_file(
             test_mzml,
@@ -241,20 +554,23 @@ class TestSendFile:
         # Server should have decompressed back to mzML
         mzml_out = _live_server_mzml["output_dir"] / "test.mzML"
         assert mzml_out.exists()
-        assert mzml_out.stat().st_size == test_mzml.stat().st_size
+        assert mzml_out.stat().st_size == test_mzml_size
 
-    def test_send_file_progress_callback(self, test_msz, _live_server):
+    def test_send_file_progress_callback(self, test_msz, _live_server, test_msz_size):
         """Progress callback should be invoked with byte deltas."""
-        deltas = []
+        # deque: true O(1) appends, no list reallocation in the callback.
+        deltas = deque()
         send_file(
             test_msz,
             _live_server["base_url"],
             progress_callback=deltas.append,
         )
         assert len(deltas) > 0
-        assert sum(deltas) == test_msz.stat().st_size
+        assert sum(deltas) == test_msz_size
 
-    def test_send_msz_file_custom_chunk_size(self, test_msz, _live_server):
+    def test_send_msz_file_custom_chunk_size(
+        self, test_msz, _live_server, test_msz_size,
+    ):
         """Send a .msz file with a small custom chunk_size."""
         result = send_file(
             test_msz,
@@ -262,7 +578,7 @@ class TestSendFile:
             chunk_size=512,
         )
         assert result.state == "done"
-        assert result.bytes_received == test_msz.stat().st_size
+        assert result.bytes_received == test_msz_size
 
     def test_send_mzml_file_custom_chunk_size(self, test_mzml, _live_server):
         """Send a .mzML file with a custom chunk_size passed to compress_stream."""
@@ -274,55 +590,55 @@ class TestSendFile:
         assert result.state == "done"
         assert result.bytes_received > 0
 
-    def test_chunk_size_affects_generator(self, test_msz, _live_server):
-        """Smaller chunk_size should produce more progress callbacks."""
+    def test_chunk_size_affects_generator(self, test_msz, test_msz_size):
+        """Smaller chunk_size should produce more progress callbacks.
+
+        Exercised at the generator layer directly — the property only
+        depends on chunking, so no network transfer is needed.
+        """
         small_deltas = []
-        send_file(
-            test_msz,
-            _live_server["base_url"],
-            progress_callback=small_deltas.append,
-            chunk_size=256,
-        )
+        for _ in _file_chunk_generator(
+            test_msz, chunk_size=256, callback=small_deltas.append,
+        ):
+            pass
         large_deltas = []
-        send_file(
-            test_msz,
-            _live_server["base_url"],
-            progress_callback=large_deltas.append,
-            chunk_size=1_048_576,
-        )
+        for _ in _file_chunk_generator(
+            test_msz, chunk_size=1_048_576, callback=large_deltas.append,
+        ):
+            pass
         # Smaller chunks should produce at least as many callbacks
         assert len(small_deltas) >= len(large_deltas)
-        # Both should transfer the full file
-        assert sum(small_deltas) == test_msz.stat().st_size
-        assert sum(large_deltas) == test_msz.stat().st_size
+        # Both should read the full file
+        assert sum(small_deltas) == test_msz_size
+        assert sum(large_deltas) == test_msz_size
 
-    def test_send_mszfile_object(self, test_msz, _live_server):
+    def test_send_mszfile_object(self, test_msz, _live_server, test_msz_size):
         """send_file accepts an MSZFile object directly."""
         msz = MSZFile(str(test_msz).encode())
         result = send_file(msz, _live_server["base_url"])
         assert result.state == "done"
         assert result.filename == "test.msz"
-        assert result.bytes_received == test_msz.stat().st_size
+        assert result.bytes_received == test_msz_size
 
-    def test_send_mzmlfile_object(self, test_mzml, _live_server):
+    def test_send_mzmlfile_object(self, mzml_file, _live_server):
         """send_file accepts an MZMLFile object directly."""
-        mzml = MZMLFile(str(test_mzml).encode())
+        mzml = mzml_file
         result = send_file(mzml, _live_server["base_url"])
         assert result.state == "done"
         assert result.filename == "test.mzML"
         assert result.bytes_received > 0
 
     def test_send_mzmlfile_object_server_decompresses(
-        self, test_mzml, _live_server_mzml,
+        self, test_mzml, mzml_file, _live_server_mzml, test_mzml_size,
     ):
         """MZMLFile object → server decompresses back to mzML."""
-        mzml = MZMLFile(str(test_mzml).encode())
+        mzml = mzml_file
         result = send_file(mzml, _live_server_mzml["base_url"])
         assert result.state == "done"
 
         mzml_out = _live_server_mzml["output_dir"] / "test.mzML"
         assert mzml_out.exists()
-        assert mzml_out.stat().st_size == test_mzml.stat().st_size
+        assert mzml_out.stat().st_size == test_mzml_size
 
     def test_send_mszxfile_object(self, test_mszx, _live_server):
         """send_file accepts an MSZXFile object directly."""
@@ -333,11 +649,93 @@ class TestSendFile:
         assert result.bytes_received == test_mszx.stat().st_size
         mszx.close()
 
+    def test_send_msz_file_intra_parallel(self, test_msz, _live_server, test_msz_size):
+        """send_file splits large .msz files into concurrent range uploads."""
+        with patch("mstransfer.client.sender._INTRA_MIN_SIZE", 0):
+            result = send_file(
+                test_msz,
+                _live_server["base_url"],
+                chunk_size=512,
+                intra_parallel=2,
+            )
+        assert result.state == "done"
+        assert result.bytes_received == test_msz_size
+
+        written = _live_server["output_dir"] / "test.msz"
+        assert filecmp.cmp(test_msz, written, shallow=False)
+
     def test_send_file_rejects_invalid_type(self, _live_server):
         """send_file raises TypeError for unsupported input types."""
         with pytest.raises(TypeError, match="Unsupported source type"):
             send_file("not_a_path_or_file", _live_server["base_url"])  # type: ignore[arg-type]
 
+    def test_concurrent_send_file_calls(
+        self, test_msz, _live_server, tmp_path, test_msz_size,
+    ):
+        """Independent send_file calls overlap safely on one live server."""
+        copies = []
+        for i in range(4):
+            copy = tmp_path / f"concurrent_{i}.msz"
+            _stage_copy(test_msz, copy)
+            copies.append(copy)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(lambda p: send_file(p, _live_server["base_url"]), copies)
+            )
+
+        assert all(r.state == "done" for r in results)
+        for i in range(4):
+            written = _live_server["output_dir"] / f"concurrent_{i}.msz"
+            assert filecmp.cmp(test_msz, written, shallow=False)
+
+
+class TestSendFileAsync:
+    @pytest.mark.asyncio
+    async def test_send_msz_file(self, test_msz, test_msz_size, _live_server):
+        """send_file_async sends a real .msz file."""
+        result = await send_file_async(test_msz, _live_server["base_url"])
+        assert result.state == "done"
+        assert result.filename == "test.msz"
+        assert result.bytes_received == test_msz_size
+
+        written = _live_server["output_dir"] / "test.msz"
+        assert filecmp.cmp(test_msz, written, shallow=False)
+
+    @pytest.mark.asyncio
+    async def test_send_mzml_file(self, test_mzml, _live_server):
+        """send_file_async compresses mzML on the fly."""
+        result = await send_file_async(test_mzml, _live_server["base_url"])
+        assert result.state == "done"
+        assert result.filename == "test.mzML"
+        assert result.bytes_received > 0
+
+    @pytest.mark.asyncio
+    async def test_send_batch_async(self, test_msz, _live_server, tmp_path):
+        """send_batch_async uploads several files concurrently."""
+        copies = []
+        for i in range(3):
+            copy = tmp_path / f"async_{i}.msz"
+            _stage_copy(test_msz, copy)
+            copies.append(copy)
+
+        results = await send_batch_async(
+            copies, _live_server["base_url"], parallel=2,
+        )
+        assert len(results) == 3
+        for r in results:
+            assert r.response is not None
+            assert r.response.state == "done"
+
+    @pytest.mark.asyncio
+    async def test_send_batch_async_captures_errors(self, tmp_path, _live_server):
+        """Invalid files surface as FileResult errors, not exceptions."""
+        bogus = tmp_path / "bogus.txt"
+        bogus.write_bytes(b"not a mass spec file")
+        results = await send_batch_async([bogus], _live_server["base_url"])
+        assert len(results) == 1
+        assert results[0].error is not None
+
 
 class TestSendBatch:
     def test_single_file(self, test_msz, _live_server):
@@ -358,7 +756,7 @@ class TestSendBatch:
         copies = []
         for i in range(3):
             copy = tmp_path / f"copy_{i}.msz"
-            copy.write_bytes(test_msz.read_bytes())
+            _stage_copy(test_msz, copy)
             copies.append(copy)
 
         results = send_batch(
@@ -376,7 +774,7 @@ class TestSendBatch:
         files = []
         for name in ["alpha.msz", "beta.msz", "gamma.msz"]:
             f = tmp_path / name
-            f.write_bytes(test_msz.read_bytes())
+            _stage_copy(test_msz, f)
             files.append(f)
 
         results = send_batch(
@@ -421,7 +819,7 @@ class TestSendBatch:
     def test_partial_failure(self, test_msz, _live_server, tmp_path):
         """One failure does not prevent other files from succeeding."""
         good_file = tmp_path / "good.msz"
-        good_file.write_bytes(test_msz.read_bytes())
+        _stage_copy(test_msz, good_file)
 
         original_send = send_file
 
@@ -431,7 +829,7 @@ class TestSendBatch:
             return original_send(file_path, *args, **kwargs)
 
         bad_file = tmp_path / "bad.msz"
-        bad_file.write_bytes(test_msz.read_bytes())
+        _stage_copy(test_msz, bad_file)
 
         with patch("mstransfer.client.sender.send_file", side_effect=flaky_send):
             results = send_batch(
@@ -472,10 +870,50 @@ class TestSendBatch:
             _, kwargs = mock_send.call_args
             assert kwargs["chunk_size"] == 4096
 
-    def test_batch_with_mscompress_objects(self, test_msz, test_mzml, _live_server):
+    def test_bundle_small_files(self, test_msz, _live_server, tmp_path):
+        """bundle_small coalesces small compressed files into one request."""
+        copies = []
+        for i in range(3):
+            copy = tmp_path / f"bundle_{i}.msz"
+            _stage_copy(test_msz, copy)
+            copies.append(copy)
+
+        with patch(
+            "mstransfer.client.sender.send_file", wraps=send_file,
+        ) as mock_send:
+            results = send_batch(
+                copies, _live_server["base_url"], parallel=2, bundle_small=True,
+            )
+        # The whole batch went through the bundle endpoint.
+        mock_send.assert_not_called()
+        assert len(results) == 3
+        for i, result in enumerate(results):
+            assert result.response is not None
+            assert result.response.state == "done"
+            written = _live_server["output_dir"] / f"bundle_{i}.msz"
+            assert filecmp.cmp(test_msz, written, shallow=False)
+
+    def test_batch_shares_one_client(self, test_msz, _live_server, tmp_path):
+        """send_batch builds a single pooled httpx.Client for the whole batch."""
+        copies = []
+        for i in range(2):
+            copy = tmp_path / f"pool_{i}.msz"
+            _stage_copy(test_msz, copy)
+            copies.append(copy)
+
+        with patch(
+            "mstransfer.client.sender.httpx.Client", wraps=httpx.Client,
+        ) as mock_client:
+            results = send_batch(copies, _live_server["base_url"], parallel=2)
+        assert mock_client.call_count == 1
+        for r in results:
+            assert r.response is not None
+            assert r.response.state == "done"
+
+    def test_batch_with_mscompress_objects(self, test_msz, mzml_file, _live_server):
         """send_batch accepts MSZFile and MZMLFile objects."""
         msz = MSZFile(str(test_msz).encode())
-        mzml = MZMLFile(str(test_mzml).encode())
+        mzml = mzml_file
         results = send_batch(
             [msz, mzml],
             _live_server["base_url"],
@@ -486,9 +924,9 @@ class TestSendBatch:
             assert r.response is not None
             assert r.response.state == "done"
 
-    def test_batch_mixed_paths_and_objects(self, test_msz, test_mzml, _live_server):
+    def test_batch_mixed_paths_and_objects(self, test_msz, mzml_file, _live_server):
         """send_batch accepts a mix of Path and mscompress objects."""
-        mzml = MZMLFile(str(test_mzml).encode())
+        mzml = mzml_file
         results = send_batch(
             [test_msz, mzml],
             _live_server["base_url"],
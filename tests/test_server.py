@@ -3,14 +3,95 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+import hashlib
+import json
+from typing import TYPE_CHECKING
 
+import httpx
+import msgspec
 import pytest
-from mscompress import MZMLFile
 
+from mstransfer.server.app import create_app, create_app_from_env
 from mstransfer.server.models import TransferState
+from mstransfer.server.routes import BUNDLE_MAX_BODY_SIZE
 from mstransfer.server.state import TransferRegistry
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _HealthBody(msgspec.Struct):
+    """Expected shape of /health responses.
+
+    Typed msgspec decoding validates presence and types in one compiled
+    pass, replacing per-key dict assertions — and fails loudly if the
+    endpoint grows or loses fields.
+    """
+
+    status: str
+    version: str
+    store_as: str
+
+
+def _json(resp: httpx.Response):
+    """Decode a response body with msgspec instead of stdlib json.
+
+    Saves parser CPU across the many status assertions in this file and
+    matches the codec the server itself uses.
+    """
+    return msgspec.json.decode(resp.content)
+
+
+def _sha256(path: Path) -> bytes:
+    """Streaming SHA-256 of a file — bounded memory, no full-file read.
+
+    hashlib.file_digest would do this in one call but needs Python 3.11+.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.digest()
+
+
+async def _aiter_file(path: Path, chunk_size: int = 1 << 20):
+    """Yield a file in chunks, so uploads stream instead of buffering.
+
+    Keeps client-side RSS at O(chunk) and lets the server start writing
+    while the body is still being produced.
+    """
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+async def _aiter_bytes(data: bytes, chunk_size: int = 1 << 20):
+    """Yield an in-memory payload in chunks without copying slices."""
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size]
+
+
+async def _do_upload(client, content, transfer_id: str, filename: str) -> dict:
+    """POST an upload, assert success, and return the decoded body.
+
+    Shared scaffolding for the upload variants; each test keeps its own
+    assertions about what landed on disk.
+    """
+    resp = await client.post(
+        "/v1/upload",
+        content=content,
+        headers={
+            "X-Transfer-ID": transfer_id,
+            "X-Original-Filename": filename,
+        },
+    )
+    assert resp.status_code == 200
+    data = _json(resp)
+    assert data["state"] == "done"
+    return data
+
+
 # ---------------------------------------------------------------------------
 # TransferRegistry unit tests
 # ---------------------------------------------------------------------------
@@ -44,11 +125,47 @@ class TestTransferRegistry:
         reg = TransferRegistry()
         assert reg.update("nope", state=TransferState.DONE) is None
 
-    def test_cleanup(self):
+    def test_add_bytes(self):
+        reg = TransferRegistry()
+        reg.create("t1", "file.msz")
+        reg.add_bytes("t1", 512)
+        reg.add_bytes("t1", 512)
+        rec = reg.get("t1")
+        assert rec is not None
+        assert rec.bytes_received == 1024
+
+    def test_add_bytes_unknown_id_is_noop(self):
         reg = TransferRegistry()
-        rec = reg.create("t1", "old.msz")
+        reg.add_bytes("nope", 100)
+        assert reg.get("nope") is None
+
+    def test_update_resets_byte_tally(self):
+        reg = TransferRegistry()
+        reg.create("t1", "file.msz")
+        reg.add_bytes("t1", 100)
+        reg.update("t1", bytes_received=2048)
+        rec = reg.get("t1")
+        assert rec is not None
+        assert rec.bytes_received == 2048
+
+    def test_record_extent_keeps_high_water_mark(self):
+        reg = TransferRegistry()
+        reg.create("t1", "file.msz")
+        reg.record_extent("t1", 512)
+        reg.record_extent("t1", 2048)
+        reg.record_extent("t1", 1024)  # out-of-order range, never shrinks
+        assert reg.get_extent("t1") == 2048
+
+    def test_get_extent_unknown_id(self):
+        reg = TransferRegistry()
+        assert reg.get_extent("nope") == 0
+
+    def test_cleanup(self):
+        now = [0.0]
+        reg = TransferRegistry(clock=lambda: now[0])
+        reg.create("t1", "old.msz")
         reg.update("t1", state=TransferState.DONE)
-        rec.created_at = datetime.now() - timedelta(seconds=600)
+        now[0] += 600
         removed = reg.cleanup(max_age_seconds=300)
         assert removed == 1
         assert reg.get("t1") is None
@@ -62,13 +179,71 @@ class TestTransferRegistry:
         assert reg.get("t1") is not None
 
     def test_cleanup_keeps_in_progress(self):
-        reg = TransferRegistry()
-        rec = reg.create("t1", "active.msz")
-        rec.created_at = datetime.now() - timedelta(seconds=600)
+        now = [0.0]
+        reg = TransferRegistry(clock=lambda: now[0])
+        reg.create("t1", "active.msz")
+        now[0] += 600
         removed = reg.cleanup(max_age_seconds=300)
         assert removed == 0
 
 
+# ---------------------------------------------------------------------------
+# App factory
+# ---------------------------------------------------------------------------
+
+
+def test_create_app_from_env(monkeypatch, tmp_path):
+    """Per-worker factory reads its configuration from the environment."""
+    monkeypatch.setenv("MSTRANSFER_OUTPUT_DIR", str(tmp_path / "env_out"))
+    monkeypatch.setenv("MSTRANSFER_STORE_AS", "mzml")
+    app = create_app_from_env()
+    assert app.state.store_as == "mzml"
+    assert app.state.output_dir == tmp_path / "env_out"
+    assert app.state.output_dir.is_dir()
+
+
+# ---------------------------------------------------------------------------
+# API-key authentication
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def authed_client(tmp_output):
+    """Client for an app created with a required API key."""
+    app = create_app(output_dir=str(tmp_output), store_as="msz", api_key="sekret")
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_auth_missing_key_rejected(authed_client):
+    resp = await authed_client.get("/v1/health")
+    assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_auth_wrong_key_rejected(authed_client):
+    resp = await authed_client.get(
+        "/v1/health", headers={"Authorization": "Bearer wrong"},
+    )
+    assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_auth_bearer_header_accepted(authed_client):
+    resp = await authed_client.get(
+        "/v1/health", headers={"Authorization": "Bearer sekret"},
+    )
+    assert resp.status_code == 200
+    assert _json(resp)["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_auth_query_param_accepted(authed_client):
+    resp = await authed_client.get("/v1/health", params={"api_key": "sekret"})
+    assert resp.status_code == 200
+
+
 # ---------------------------------------------------------------------------
 # Server route tests (via ASGI transport)
 # ---------------------------------------------------------------------------
@@ -78,59 +253,52 @@ class TestTransferRegistry:
 async def test_health(msz_client):
     resp = await msz_client.get("/v1/health")
     assert resp.status_code == 200
-    data = resp.json()
-    assert data["status"] == "ok"
-    assert data["store_as"] == "msz"
-    assert "version" in data
+    data = msgspec.json.decode(resp.content, type=_HealthBody)
+    assert data.status == "ok"
+    assert data.store_as == "msz"
+
+
+@pytest.mark.asyncio
+async def test_health_answers_head(msz_client):
+    """The CLI health check uses HEAD; @get alone would 405 it."""
+    resp = await msz_client.head("/v1/health")
+    assert resp.status_code == 200
 
 
 @pytest.mark.asyncio
 async def test_health_mzml_mode(mzml_client):
     resp = await mzml_client.get("/v1/health")
     assert resp.status_code == 200
-    assert resp.json()["store_as"] == "mzml"
+    assert msgspec.json.decode(resp.content, type=_HealthBody).store_as == "mzml"
 
 
 @pytest.mark.asyncio
-async def test_upload_msz_store_as_msz(msz_client, tmp_output, test_msz):
+async def test_upload_msz_store_as_msz(
+    msz_client, tmp_output, test_msz, msz_payload, msz_payload_sha256
+):
     """Upload a real .msz file; server stores as msz (passthrough)."""
-    payload = test_msz.read_bytes()
-    resp = await msz_client.post(
-        "/v1/upload",
-        content=payload,
-        headers={
-            "X-Transfer-ID": "msz-store-msz",
-            "X-Original-Filename": "test.msz",
-        },
+    payload = msz_payload
+    data = await _do_upload(
+        msz_client, _aiter_file(test_msz), "msz-store-msz", "test.msz",
     )
-    assert resp.status_code == 200
-    data = resp.json()
     assert data["transfer_id"] == "msz-store-msz"
     assert data["filename"] == "test.msz"
-    assert data["state"] == "done"
     assert data["bytes_received"] == len(payload)
-    # Verify written file is byte-identical
+    # Verify written file is byte-identical (compared by digest)
     written = tmp_output / "test.msz"
     assert written.exists()
-    assert written.read_bytes() == payload
+    assert written.stat().st_size == len(payload)
+    assert _sha256(written) == msz_payload_sha256
 
 
 @pytest.mark.asyncio
-async def test_upload_msz_store_as_mzml(mzml_client, tmp_output, test_msz):
+async def test_upload_msz_store_as_mzml(mzml_client, tmp_output, test_msz, msz_payload):
     """Upload a real .msz file; server decompresses to mzML."""
-    payload = test_msz.read_bytes()
-    resp = await mzml_client.post(
-        "/v1/upload",
-        content=payload,
-        headers={
-            "X-Transfer-ID": "msz-store-mzml",
-            "X-Original-Filename": "test.msz",
-        },
+    payload = msz_payload
+    data = await _do_upload(
+        mzml_client, _aiter_file(test_msz), "msz-store-mzml", "test.msz",
     )
-    assert resp.status_code == 200
-    data = resp.json()
     assert data["transfer_id"] == "msz-store-mzml"
-    assert data["state"] == "done"
     assert data["bytes_received"] == len(payload)
 
     # The temp .msz should be cleaned up
@@ -144,22 +312,14 @@ async def test_upload_msz_store_as_mzml(mzml_client, tmp_output, test_msz):
 
 
 @pytest.mark.asyncio
-async def test_upload_mzml_stream_store_as_msz(msz_client, tmp_output, test_mzml):
+async def test_upload_mzml_stream_store_as_msz(
+    msz_client, tmp_output, compressed_mzml_bytes
+):
     """Simulate sender compressing mzML → msz on the fly, server stores msz."""
-    mzml = MZMLFile(str(test_mzml).encode())
-    compressed = b"".join(mzml.compress_stream(chunk_size=1_048_576))
-
-    resp = await msz_client.post(
-        "/v1/upload",
-        content=compressed,
-        headers={
-            "X-Transfer-ID": "mzml-stream-msz",
-            "X-Original-Filename": "test.mzML",
-        },
+    compressed = compressed_mzml_bytes
+    data = await _do_upload(
+        msz_client, _aiter_bytes(compressed), "mzml-stream-msz", "test.mzML",
     )
-    assert resp.status_code == 200
-    data = resp.json()
-    assert data["state"] == "done"
     assert data["bytes_received"] == len(compressed)
 
     written = tmp_output / "test.msz"
@@ -168,32 +328,151 @@ async def test_upload_mzml_stream_store_as_msz(msz_client, tmp_output, test_mzml
 
 
 @pytest.mark.asyncio
-async def test_upload_mzml_stream_store_as_mzml(mzml_client, tmp_output, test_mzml):
+async def test_upload_mzml_stream_store_as_mzml(
+    mzml_client, tmp_output, test_mzml, compressed_mzml_bytes, test_mzml_size):
     """Sender compresses mzML → msz, server decompresses back to mzML."""
-    mzml = MZMLFile(str(test_mzml).encode())
-    compressed = b"".join(mzml.compress_stream(chunk_size=1_048_576))
-
-    resp = await mzml_client.post(
-        "/v1/upload",
-        content=compressed,
-        headers={
-            "X-Transfer-ID": "mzml-roundtrip",
-            "X-Original-Filename": "test.mzML",
-        },
+    compressed = compressed_mzml_bytes
+    await _do_upload(
+        mzml_client, _aiter_bytes(compressed), "mzml-roundtrip", "test.mzML",
     )
-    assert resp.status_code == 200
-    data = resp.json()
-    assert data["state"] == "done"
 
     # Round-tripped mzML should exist
     mzml_out = tmp_output / "test.mzML"
     assert mzml_out.exists()
     # Should be approximately the same size as the original
-    original_size = test_mzml.stat().st_size
+    original_size = test_mzml_size
     output_size = mzml_out.stat().st_size
     assert output_size == original_size
 
 
+@pytest.mark.asyncio
+async def test_chunked_upload_roundtrip(
+    msz_client, tmp_output, msz_payload, msz_payload_sha256
+):
+    """Upload a file as two offset ranges, then finalize with /complete."""
+    payload = msz_payload
+    mid = len(payload) // 2
+    headers = {"X-Original-Filename": "chunked.msz"}
+
+    for offset, part in ((mid, payload[mid:]), (0, payload[:mid])):
+        resp = await msz_client.post(
+            f"/v1/upload/chunked-test/chunk?offset={offset}",
+            content=part,
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert _json(resp)["received"] == len(part)
+
+    resp = await msz_client.post("/v1/upload/chunked-test/complete")
+    assert resp.status_code == 200
+    data = _json(resp)
+    assert data["state"] == "done"
+    assert data["bytes_received"] == len(payload)
+
+    written = tmp_output / "chunked.msz"
+    assert written.exists()
+    assert _sha256(written) == msz_payload_sha256
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_rejected_multi_worker(tmp_output, msz_payload):
+    """Chunked endpoints refuse to run when workers don't share a registry."""
+    app = create_app(
+        output_dir=str(tmp_output), store_as="msz", multi_worker=True,
+    )
+    transport = httpx.ASGITransport(app=app)
+    client = httpx.AsyncClient(transport=transport, base_url="http://test")
+
+    resp = await client.post(
+        "/v1/upload/multi-worker-test/chunk?offset=0",
+        content=msz_payload,
+        headers={"X-Original-Filename": "chunked.msz"},
+    )
+    assert resp.status_code == 503
+
+    resp = await client.post("/v1/upload/multi-worker-test/complete")
+    assert resp.status_code == 503
+
+    # The single-request upload path is unaffected.
+    resp = await client.get("/v1/health")
+    assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_complete_unknown_id(msz_client):
+    resp = await msz_client.post("/v1/upload/never-started/complete")
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_upload_bundle(msz_client, tmp_output, msz_payload, msz_payload_sha256):
+    """Several small files land from one bundled request."""
+    manifest = json.dumps([
+        {"transfer_id": "bundle-1", "filename": "one.msz", "size": len(msz_payload)},
+        {"transfer_id": "bundle-2", "filename": "two.msz", "size": len(msz_payload)},
+    ])
+    resp = await msz_client.post(
+        "/v1/upload/bundle",
+        content=msz_payload + msz_payload,
+        headers={"X-Bundle-Manifest": manifest},
+    )
+    assert resp.status_code == 200
+    data = _json(resp)
+    assert [d["transfer_id"] for d in data] == ["bundle-1", "bundle-2"]
+    assert all(d["state"] == "done" for d in data)
+    assert _sha256(tmp_output / "one.msz") == msz_payload_sha256
+    assert _sha256(tmp_output / "two.msz") == msz_payload_sha256
+
+
+@pytest.mark.asyncio
+async def test_upload_bundle_size_mismatch(msz_client, msz_payload):
+    manifest = json.dumps([
+        {
+            "transfer_id": "bundle-bad",
+            "filename": "bad.msz",
+            "size": len(msz_payload) + 1,
+        },
+    ])
+    resp = await msz_client.post(
+        "/v1/upload/bundle",
+        content=msz_payload,
+        headers={"X-Bundle-Manifest": manifest},
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_upload_bundle_over_size_cap_rejected(msz_client):
+    manifest = json.dumps([
+        {
+            "transfer_id": "bundle-huge",
+            "filename": "huge.msz",
+            "size": BUNDLE_MAX_BODY_SIZE + 1,
+        },
+    ])
+    resp = await msz_client.post(
+        "/v1/upload/bundle",
+        content=b"x",
+        headers={"X-Bundle-Manifest": manifest},
+    )
+    assert resp.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_upload_bundle_missing_manifest(msz_client):
+    resp = await msz_client.post("/v1/upload/bundle", content=b"x")
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_missing_filename(msz_client):
+    resp = await msz_client.post(
+        "/v1/upload/chunk-no-name/chunk",
+        content=b"data",
+    )
+    assert resp.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_upload_missing_transfer_id(msz_client):
     resp = await msz_client.post(
@@ -202,25 +481,114 @@ async def test_upload_missing_transfer_id(msz_client):
         headers={"X-Original-Filename": "test.msz"},
     )
     assert resp.status_code == 400
-    assert "X-Transfer-ID" in resp.json()["detail"]
+    assert "X-Transfer-ID" in _json(resp)["detail"]
 
 
 @pytest.mark.asyncio
-async def test_transfer_status(msz_client, test_msz):
+async def test_batch_submit_allocates_ids(msz_client):
+    resp = await msz_client.post(
+        "/v1/transfers/batch",
+        json={"files": ["a.mzML", "b.msz"]},
+    )
+    assert resp.status_code == 200
+    transfers = _json(resp)["transfers"]
+    assert [t["filename"] for t in transfers] == ["a.mzML", "b.msz"]
+    ids = [t["transfer_id"] for t in transfers]
+    assert len(set(ids)) == 2
+
+    # The allocated IDs are immediately visible in the registry.
+    status = await msz_client.get(f"/v1/transfer/{ids[0]}/status")
+    assert status.status_code == 200
+    assert _json(status)["state"] == "receiving"
+
+
+@pytest.mark.asyncio
+async def test_batch_status_poll(msz_client, msz_payload_mv):
     await msz_client.post(
         "/v1/upload",
-        content=test_msz.read_bytes(),
+        content=_aiter_bytes(msz_payload_mv),
         headers={
-            "X-Transfer-ID": "status-test",
-            "X-Original-Filename": "status.msz",
+            "X-Transfer-ID": "batch-status-test",
+            "X-Original-Filename": "batch.msz",
         },
     )
+    resp = await msz_client.post(
+        "/v1/transfer/status",
+        json={"ids": ["batch-status-test", "unknown-id"]},
+    )
+    assert resp.status_code == 200
+    records = _json(resp)
+    assert set(records) == {"batch-status-test"}
+    assert records["batch-status-test"]["state"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_transfer_status(msz_client, test_msz, msz_payload_mv, test_msz_size):
+    await _do_upload(
+        msz_client, _aiter_bytes(msz_payload_mv), "status-test", "status.msz",
+    )
     resp = await msz_client.get("/v1/transfer/status-test/status")
     assert resp.status_code == 200
-    data = resp.json()
+    data = _json(resp)
     assert data["transfer_id"] == "status-test"
     assert data["state"] == "done"
-    assert data["bytes_received"] == test_msz.stat().st_size
+    assert data["bytes_received"] == test_msz_size
+
+
+@pytest.mark.asyncio
+async def test_transfer_state_plaintext(msz_client, msz_payload_mv):
+    payload = msz_payload_mv
+    await msz_client.post(
+        "/v1/upload",
+        content=_aiter_bytes(payload),
+        headers={
+            "X-Transfer-ID": "plain-state-test",
+            "X-Original-Filename": "plain.msz",
+        },
+    )
+    resp = await msz_client.get("/v1/transfer/plain-state-test/state")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    state, bytes_received = resp.text.strip().split(" ")
+    assert state == "done"
+    assert int(bytes_received) == len(payload)
+
+
+@pytest.mark.asyncio
+async def test_transfer_state_not_found(msz_client):
+    resp = await msz_client.get("/v1/transfer/nonexistent/state")
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_transfer_events_stream(msz_client, msz_payload_mv):
+    """The events stream emits the record and closes on a terminal state."""
+    await msz_client.post(
+        "/v1/upload",
+        content=_aiter_bytes(msz_payload_mv),
+        headers={
+            "X-Transfer-ID": "events-test",
+            "X-Original-Filename": "events.msz",
+        },
+    )
+    last = None
+    async with msz_client.stream(
+        "GET", "/v1/transfer/events-test/events"
+    ) as resp:
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        async for line in resp.aiter_lines():
+            if line.startswith("data: "):
+                last = json.loads(line[6:])
+    assert last is not None
+    assert last["transfer_id"] == "events-test"
+    assert last["state"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_transfer_events_not_found(msz_client):
+    resp = await msz_client.get("/v1/transfer/nonexistent/events")
+    assert resp.status_code == 404
 
 
 @pytest.mark.asyncio
@@ -230,11 +598,11 @@ async def test_transfer_status_not_found(msz_client):
 
 
 @pytest.mark.asyncio
-async def test_upload_preserves_filename_stem(msz_client, tmp_output, test_msz):
+async def test_upload_preserves_filename_stem(msz_client, tmp_output, msz_payload_mv):
     """Uploaded file should use the original filename's stem."""
     await msz_client.post(
         "/v1/upload",
-        content=test_msz.read_bytes(),
+        content=_aiter_bytes(msz_payload_mv),
         headers={
             "X-Transfer-ID": "stem-test",
             "X-Original-Filename": "my_experiment.mzML",
@@ -244,21 +612,41 @@ async def test_upload_preserves_filename_stem(msz_client, tmp_output, test_msz):
 
 
 @pytest.mark.asyncio
-async def test_upload_missing_filename(msz_client, tmp_output, test_msz):
+async def test_upload_filename_traversal_stays_in_output_dir(
+    msz_client, tmp_output, msz_payload_mv
+):
+    """Directory components in X-Original-Filename must not escape output_dir."""
+    await msz_client.post(
+        "/v1/upload",
+        content=_aiter_bytes(msz_payload_mv),
+        headers={
+            "X-Transfer-ID": "traversal-test",
+            "X-Original-Filename": "../../escape.msz",
+        },
+    )
+    assert not (tmp_output.parent / "escape.msz").exists()
+    assert not (tmp_output.parent.parent / "escape.msz").exists()
+    assert (tmp_output / "escape.msz").exists()
+
+
+@pytest.mark.asyncio
+async def test_upload_missing_filename(msz_client, tmp_output, msz_payload):
     """Missing X-Original-Filename header should return 400."""
     resp = await msz_client.post(
         "/v1/upload",
-        content=test_msz.read_bytes(),
+        content=msz_payload,
         headers={"X-Transfer-ID": "default-name-test"},
     )
     assert resp.status_code == 400
-    assert "X-Original-Filename" in resp.json()["detail"]
+    assert "X-Original-Filename" in _json(resp)["detail"]
 
 
 @pytest.mark.asyncio
-async def test_decompress_does_not_block_event_loop(mzml_client, tmp_output, test_msz):
+async def test_decompress_does_not_block_event_loop(
+    mzml_app, mzml_client, tmp_output, msz_payload
+):
     """Decompression should be offloaded so concurrent requests aren't blocked."""
-    payload = test_msz.read_bytes()
+    payload = msz_payload
 
     upload_task = asyncio.create_task(
         mzml_client.post(
@@ -271,8 +659,24 @@ async def test_decompress_does_not_block_event_loop(mzml_client, tmp_output, tes
         )
     )
 
-    # Give the upload a moment to start processing
-    await asyncio.sleep(0.05)
+    # Wait (event-driven, no fixed sleep) until the upload has moved past
+    # receiving — decompression is then underway or already finished.
+    registry = mzml_app.state.transfers
+
+    async def _wait_past_receiving() -> None:
+        version = 0
+        while True:
+            record, version = await asyncio.to_thread(
+                registry.wait_for_change, "blocking-test-upload", version, 1.0,
+            )
+            if record is not None and record.state in (
+                TransferState.DECOMPRESSING,
+                TransferState.DONE,
+                TransferState.ERROR,
+            ):
+                return
+
+    await asyncio.wait_for(_wait_past_receiving(), timeout=2.0)
 
     # Health check should respond promptly even while decompression runs
     health_resp = await asyncio.wait_for(
@@ -283,4 +687,4 @@ async def test_decompress_does_not_block_event_loop(mzml_client, tmp_output, tes
 
     upload_resp = await upload_task
     assert upload_resp.status_code == 200
-    assert upload_resp.json()["state"] == "done"
+    assert _json(upload_resp)["state"] == "done"